@@ -1,22 +1,28 @@
 import httpx
+import asyncio
 import logging
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from opentelemetry import metrics
 from pydantic import BaseModel
-from tenacity import AsyncRetrying, stop_after_attempt, wait_fixed
+
+from platform_core.batcher import BatchItemError, MicroBatcher, get_batcher
+from platform_core.breaker import CircuitOpenError
+from platform_core.client import get_http_client
+from platform_core.forwarder import build_forwarder
+from platform_core.ledger import stamper
+from platform_core.stats import StatsCounter
 
 from core.config import config
+from core.outbox import OutboxWorker, get_outbox_worker
 
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
-_stats = {
-    "total_requests": 0,
-    "total_http_attempts": 0,
-    "total_retries": 0,
-    "succeeded_requests": 0,
-    "failed_requests": 0,
-}
+meter = metrics.get_meter(__name__)
+
+forwarder = build_forwarder(config)
+_requests = StatsCounter(meter, "forwarder.requests", description="Messages accepted for forwarding, by outcome")
 
 
 class Message(BaseModel):
@@ -24,35 +30,55 @@ class Message(BaseModel):
 
 
 @router.post("/api/message-a")
-async def accept_and_forward(payload: Message):
-    _stats["total_requests"] += 1
-    attempt_number = 0
-    attempt_count = 3
+async def accept_and_forward(
+    payload: Message,
+    client: httpx.AsyncClient = Depends(get_http_client),
+    outbox_worker: OutboxWorker | None = Depends(get_outbox_worker),
+    batcher: MicroBatcher | None = Depends(get_batcher),
+) -> dict:
+    message = stamper.stamp(payload.model_dump())
 
-    try:
-        async for attempt in AsyncRetrying(
-            stop=stop_after_attempt(attempt_count),
-            wait=wait_fixed(0.2),
-            reraise=True,
-        ):
-            with attempt:
-                attempt_number += 1
-                _stats["total_http_attempts"] += 1
-
-                async with httpx.AsyncClient(timeout=1) as client:
-                    response = await client.post(
-                        f"{config.SERVICE_B_URL}/api/message-b",
-                        json=payload.model_dump(),
-                    )
-
-        _stats["succeeded_requests"] += 1
-
-    except Exception:
-        _stats["failed_requests"] += 1
+    if outbox_worker is not None:
+        await outbox_worker.outbox.append(message)
+        outbox_worker.notify()
+        _requests.add(outcome="queued")
+        return {"result": "ok"}
 
+    outcome = "failed"
+
+    try:
+        attempts = await forwarder.forward(client, batcher, message)
+        outcome = "succeeded"
+        logger.debug("Message succeeded after %d attempt(s)", attempts)
+    except Exception as e:
+        logger.warning("Delivery failed: %r", e)
     finally:
-        retries_made = max(attempt_number - 1, 0)
-        _stats["total_retries"] += retries_made
-        logger.info("%s", _stats)
+        _requests.add(outcome=outcome)
 
     return {"result": "ok"}
+
+
+async def deliver_messages(
+    client: httpx.AsyncClient,
+    batcher: MicroBatcher | None,
+    messages: list[dict],
+) -> list[Exception | None]:
+    """
+    Single delivery attempt per message, used by the outbox worker; returns the error of each failed one
+    """
+
+    async def deliver(message: dict) -> Exception | None:
+        try:
+            await forwarder.attempt(client, batcher, message)
+        except (httpx.HTTPError, BatchItemError, CircuitOpenError) as e:
+            logger.warning("Outbox delivery failed: %r", e)
+            return e
+
+        return None
+
+    return list(await asyncio.gather(*(deliver(message) for message in messages)))
+
+
+def is_retryable_delivery(error: Exception) -> bool:
+    # An open breaker only postpones the delivery; otherwise the request path's classification applies.
+    return isinstance(error, CircuitOpenError) or forwarder.retry_policy.is_retryable(error)
@@ -1,10 +1,14 @@
-from pydantic_settings import BaseSettings
+from platform_core.config import ForwarderConfig
 
 
-class Config(BaseSettings):
-    APP_NAME: str
-    SERVICE_B_URL: str
-    OPENTELEMETRY_ENDRPOIND: str
+class Config(ForwarderConfig):
+    OUTBOX_ENABLED: bool = False
+    OUTBOX_PATH: str = "/data/outbox.sqlite3"
+    OUTBOX_BATCH_SIZE: int = 64
+    OUTBOX_POLL_INTERVAL: float = 0.5
+    OUTBOX_MAX_ATTEMPTS: int = 20
+    OUTBOX_INITIAL_BACKOFF: float = 0.2
+    OUTBOX_MAX_BACKOFF: float = 30.0
 
 
 config: Config = Config()
@@ -0,0 +1,256 @@
+import json
+import time
+import asyncio
+import logging
+
+from typing import Awaitable, Callable
+
+from fastapi import Request
+from opentelemetry import metrics
+
+from platform_core.retry import full_jitter_backoff
+from platform_core.sqlite import SqliteExecutor
+from platform_core.stats import StatsCounter
+
+
+logger = logging.getLogger(__name__)
+meter = metrics.get_meter(__name__)
+
+_appended = StatsCounter(meter, "outbox.appended", description="Messages written to the outbox")
+_delivered = StatsCounter(meter, "outbox.delivered", description="Outbox messages acknowledged by ServiceB")
+_redeliveries = StatsCounter(meter, "outbox.redeliveries", description="Outbox deliveries rescheduled after a failure")
+_dead_lettered = StatsCounter(
+    meter,
+    "outbox.dead_lettered",
+    description="Outbox messages given up on after a permanent failure or too many attempts",
+)
+
+
+class SqliteOutbox:
+    """
+    Durable FIFO of messages waiting to be delivered, stored in a WAL-mode SQLite file
+
+    Fetched rows are leased for `lease_seconds`, so several worker processes can
+    drain the same file and rows claimed by a crashed process become due again.
+    Messages that cannot be delivered are moved to `outbox_dead_letter` with the
+    last error, for inspection or a manual replay.
+    """
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS outbox ("
+        " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+        " payload TEXT NOT NULL,"
+        " attempts INTEGER NOT NULL DEFAULT 0,"
+        " next_attempt_at REAL NOT NULL,"
+        " created_at REAL NOT NULL"
+        ")",
+        "CREATE INDEX IF NOT EXISTS outbox_next_attempt_at ON outbox (next_attempt_at)",
+        "CREATE TABLE IF NOT EXISTS outbox_dead_letter ("
+        " id INTEGER PRIMARY KEY,"
+        " payload TEXT NOT NULL,"
+        " attempts INTEGER NOT NULL,"
+        " error TEXT NOT NULL,"
+        " created_at REAL NOT NULL,"
+        " failed_at REAL NOT NULL"
+        ")",
+    )
+
+    def __init__(self, *, path: str, lease_seconds: float = 30.0) -> None:
+        self._lease_seconds = lease_seconds
+        self._db = SqliteExecutor(path, schema=self.SCHEMA, thread_name_prefix="outbox-sqlite")
+
+    async def open(self) -> None:
+        await self._db.open()
+
+    async def close(self) -> None:
+        await self._db.close()
+
+    async def append(self, payload: dict) -> int:
+        message_id = await self._db.run(self._insert, json.dumps(payload), time.time())
+        _appended.add()
+        return message_id
+
+    async def claim_due(self, limit: int) -> list[tuple[int, dict, int]]:
+        rows = await self._db.run(self._claim, limit, time.time())
+        return [(message_id, json.loads(payload), attempts) for message_id, payload, attempts in rows]
+
+    async def acknowledge(self, message_ids: list[int]) -> None:
+        if message_ids:
+            await self._db.run(self._delete, message_ids)
+            _delivered.add(len(message_ids))
+
+    async def reschedule(self, retries: list[tuple[int, float]]) -> None:
+        if retries:
+            await self._db.run(self._postpone, retries, time.time())
+            _redeliveries.add(len(retries))
+
+    async def dead_letter(self, failures: list[tuple[int, str]]) -> None:
+        if failures:
+            await self._db.run(self._move_to_dead_letter, failures, time.time())
+            _dead_lettered.add(len(failures))
+
+    async def pending(self) -> int:
+        return await self._db.run(self._count)
+
+    def _insert(self, payload: str, now: float) -> int:
+        cursor = self._db.connection.execute(
+            "INSERT INTO outbox (payload, next_attempt_at, created_at) VALUES (?, ?, ?)",
+            (payload, now, now),
+        )
+        return cursor.lastrowid
+
+    def _claim(self, limit: int, now: float) -> list[tuple]:
+        cursor = self._db.connection.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            rows = cursor.execute(
+                "SELECT id, payload, attempts FROM outbox WHERE next_attempt_at <= ? ORDER BY id LIMIT ?",
+                (now, limit),
+            ).fetchall()
+            cursor.executemany(
+                "UPDATE outbox SET next_attempt_at = ? WHERE id = ?",
+                [(now + self._lease_seconds, row[0]) for row in rows],
+            )
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+
+        return rows
+
+    def _delete(self, message_ids: list[int]) -> None:
+        self._db.connection.executemany(
+            "DELETE FROM outbox WHERE id = ?",
+            [(message_id,) for message_id in message_ids],
+        )
+
+    def _postpone(self, retries: list[tuple[int, float]], now: float) -> None:
+        cursor = self._db.connection.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            cursor.executemany(
+                "UPDATE outbox SET attempts = attempts + 1, next_attempt_at = ? WHERE id = ?",
+                [(now + delay, message_id) for message_id, delay in retries],
+            )
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+
+    def _move_to_dead_letter(self, failures: list[tuple[int, str]], now: float) -> None:
+        cursor = self._db.connection.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            cursor.executemany(
+                "INSERT INTO outbox_dead_letter (id, payload, attempts, error, created_at, failed_at) "
+                "SELECT id, payload, attempts + 1, ?, created_at, ? FROM outbox WHERE id = ?",
+                [(error, now, message_id) for message_id, error in failures],
+            )
+            cursor.executemany(
+                "DELETE FROM outbox WHERE id = ?",
+                [(message_id,) for message_id, _ in failures],
+            )
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+
+    def _count(self) -> int:
+        return self._db.connection.execute("SELECT COUNT(*) FROM outbox").fetchone()[0]
+
+
+class OutboxWorker:
+    """
+    Background task that drains the outbox in batches until every message is acknowledged or dead-lettered
+
+    `deliver` returns, per message, None once ServiceB acknowledged it or the
+    error of the attempt. A message is retried with backoff while `is_retryable`
+    accepts its error, up to `max_attempts` attempts, and dead-lettered otherwise.
+    """
+
+    def __init__(
+        self,
+        outbox: SqliteOutbox,
+        deliver: Callable[[list[dict]], Awaitable[list[Exception | None]]],
+        *,
+        is_retryable: Callable[[Exception], bool],
+        batch_size: int,
+        poll_interval: float,
+        max_attempts: int,
+        initial_backoff: float,
+        max_backoff: float,
+    ) -> None:
+        self.outbox = outbox
+        self.deliver = deliver
+        self.is_retryable = is_retryable
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    def notify(self) -> None:
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+
+            try:
+                claimed = await self._drain_once()
+            except Exception:
+                logger.exception("Outbox delivery round failed")
+                claimed = 0
+
+            if claimed < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def _drain_once(self) -> int:
+        rows = await self.outbox.claim_due(self.batch_size)
+        if not rows:
+            return 0
+
+        errors = await self.deliver([payload for _, payload, _ in rows])
+
+        acknowledged = []
+        retries = []
+        failures = []
+
+        for (message_id, _, attempts), error in zip(rows, errors):
+            if error is None:
+                acknowledged.append(message_id)
+            elif self.is_retryable(error) and attempts + 1 < self.max_attempts:
+                retries.append((message_id, self._backoff(attempts)))
+            else:
+                logger.error("Outbox message %d dead-lettered after %d attempt(s): %r", message_id, attempts + 1, error)
+                failures.append((message_id, f"{type(error).__name__}: {error}"))
+
+        await self.outbox.acknowledge(acknowledged)
+        await self.outbox.reschedule(retries)
+        await self.outbox.dead_letter(failures)
+
+        return len(rows)
+
+    def _backoff(self, attempts: int) -> float:
+        return full_jitter_backoff(attempts + 1, initial_backoff=self.initial_backoff, max_backoff=self.max_backoff)
+
+
+def get_outbox_worker(request: Request) -> OutboxWorker | None:
+    return request.app.state.outbox_worker
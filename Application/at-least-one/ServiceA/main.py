@@ -1,30 +1,46 @@
-from fastapi import FastAPI
-from fastapi.middleware import Middleware
-
-from core.logging import setup_logger
-from core.opentelemetry import setup_observability
-from core.config import config
-from core.middleware import LoggerTracingMiddleware
-
-from api.v1 import router as router_v1
-
+from contextlib import asynccontextmanager
+from functools import partial
 
-def configure_application() -> FastAPI:
-    setup_logger()
-
-    app = FastAPI(
-        title=config.APP_NAME,
-        middleware=[Middleware(LoggerTracingMiddleware)],
-    )
-    app.include_router(router_v1)
-
-    setup_observability(
-        app=app,
-        service_name=config.APP_NAME,
-        otel_endpoint=config.OPENTELEMETRY_ENDRPOIND,
-    )
-
-    return app
+from fastapi import FastAPI
 
+from platform_core.app import create_app
+from platform_core.ledger import sender_router
 
-app = configure_application()
+from core.config import config
+from core.outbox import OutboxWorker, SqliteOutbox
+
+from api.v1 import deliver_messages, forwarder, is_retryable_delivery, router as router_v1
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.batcher = forwarder.build_batcher(app.state.http_client)
+
+    app.state.outbox_worker = None
+    if config.OUTBOX_ENABLED:
+        outbox = SqliteOutbox(path=config.OUTBOX_PATH)
+        await outbox.open()
+
+        app.state.outbox_worker = OutboxWorker(
+            outbox,
+            partial(deliver_messages, app.state.http_client, app.state.batcher),
+            is_retryable=is_retryable_delivery,
+            batch_size=config.OUTBOX_BATCH_SIZE,
+            poll_interval=config.OUTBOX_POLL_INTERVAL,
+            max_attempts=config.OUTBOX_MAX_ATTEMPTS,
+            initial_backoff=config.OUTBOX_INITIAL_BACKOFF,
+            max_backoff=config.OUTBOX_MAX_BACKOFF,
+        )
+        app.state.outbox_worker.start()
+
+    try:
+        yield
+    finally:
+        if app.state.outbox_worker is not None:
+            await app.state.outbox_worker.stop()
+            await app.state.outbox_worker.outbox.close()
+        if app.state.batcher is not None:
+            await app.state.batcher.close()
+
+
+app = create_app(config, routers=[router_v1, sender_router], lifespan=lifespan, http_client=True)
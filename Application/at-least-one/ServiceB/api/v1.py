@@ -1,42 +1,19 @@
-import logging
-import random
-import asyncio
+from fastapi import APIRouter, Depends
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from platform_core.faults import FaultEngine, get_fault_engine
+from platform_core.receiver import Message, MessageBatch, Receiver
+from platform_core.serialization import CodecRoute
 
-logger = logging.getLogger(__name__)
-router = APIRouter()
 
-_stats = {
-    "total_requests": 0,
-    "delayed_requests": 0,
-    "failed_requests": 0,
-    "successful_requests": 0,
-}
-
-
-class Message(BaseModel):
-    message: str
+router = APIRouter(route_class=CodecRoute)
+receiver = Receiver(outcome="succeeded")
 
 
 @router.post("/api/message-b")
-async def receive_message(payload: Message):
-    _stats["total_requests"] += 1
-
-    r = random.random()
-
-    if r < 0.2:
-        delay_s = random.uniform(1.2, 3.5)
-        _stats["delayed_requests"] += 1
-        await asyncio.sleep(delay_s)
-
-    elif r < 0.3:
-        _stats["failed_requests"] += 1
-        logger.info("%s", _stats)
-        raise HTTPException(status_code=500, detail="Random failure")
+async def receive_message(payload: Message, faults: FaultEngine = Depends(get_fault_engine)) -> dict:
+    return await receiver.receive(faults, payload)
 
-    _stats["successful_requests"] += 1
-    logger.info("%s", _stats)
 
-    return {"result": "ok"}
+@router.post("/api/message-b/batch")
+async def receive_batch(batch: MessageBatch, faults: FaultEngine = Depends(get_fault_engine)) -> dict:
+    return await receiver.receive_batch(faults, batch.messages)
@@ -1,9 +1,16 @@
-from pydantic_settings import BaseSettings
+from platform_core.config import PlatformConfig
+from platform_core.faults import Fault, FaultProfile, Latency
 
 
-class Config(BaseSettings):
-    APP_NAME: str
-    OPENTELEMETRY_ENDRPOIND: str
+class Config(PlatformConfig):
+    ADMISSION_PATH_PREFIX: str = "/api/message-b"
+
+    FAULTS_PROFILE: FaultProfile = FaultProfile(
+        faults=[
+            Fault(probability=0.2, latency=Latency(distribution="uniform", low=1.2, high=3.5)),
+            Fault(probability=0.1, status_code=500, detail="Random failure"),
+        ],
+    )
 
 
 config: Config = Config()
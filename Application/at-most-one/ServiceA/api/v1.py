@@ -1,18 +1,28 @@
 import httpx
 import logging
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from opentelemetry import metrics
 from pydantic import BaseModel
+
+from platform_core.batcher import BatchItemError, MicroBatcher, get_batcher
+from platform_core.breaker import CircuitOpenError
+from platform_core.client import get_http_client
+from platform_core.deadline import DeadlineExceededError
+from platform_core.forwarder import build_forwarder
+from platform_core.ledger import stamper
+from platform_core.stats import StatsCounter
+
 from core.config import config
 
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
-_stats = {
-    "total_requests": 0,
-    "total_outbound_requests": 0,
-    "delivery_failures": 0,
-}
+meter = metrics.get_meter(__name__)
+
+# A single attempt per message: retries or hedges could deliver it twice.
+forwarder = build_forwarder(config, retries=False)
+_requests = StatsCounter(meter, "forwarder.requests", description="Messages accepted for forwarding, by outcome")
 
 
 class Message(BaseModel):
@@ -20,19 +30,21 @@ class Message(BaseModel):
 
 
 @router.post("/api/message-a")
-async def accept_and_forward(payload: Message):
-    _stats["total_requests"] += 1
-    _stats["total_outbound_requests"] += 1
+async def accept_and_forward(
+    payload: Message,
+    client: httpx.AsyncClient = Depends(get_http_client),
+    batcher: MicroBatcher | None = Depends(get_batcher),
+) -> dict:
+    outcome = "sent"
+    message = stamper.stamp(payload.model_dump())
 
     try:
-        async with httpx.AsyncClient(timeout=2.0) as client:
-            await client.post(
-                f"{config.SERVICE_B_URL}/api/message-b",
-                json=payload.model_dump(),
-            )
-    except httpx.HTTPError:
-        _stats["delivery_failures"] += 1
-
-    logger.info("%s", _stats)
+        await forwarder.forward(client, batcher, message)
+    except (httpx.HTTPError, BatchItemError, CircuitOpenError, DeadlineExceededError) as e:
+        outcome = "failed"
+        logger.warning("Delivery failed: %r", e)
+
+    _requests.add(outcome=outcome)
+    logger.debug("Message %s", outcome)
 
     return {"result": "ok"}
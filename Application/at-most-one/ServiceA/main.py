@@ -1,30 +1,24 @@
-from fastapi import FastAPI
-from fastapi.middleware import Middleware
+from contextlib import asynccontextmanager
 
-from core.logging import setup_logger
-from core.opentelemetry import setup_observability
-from core.config import config
-from core.middleware import LoggerTracingMiddleware
+from fastapi import FastAPI
 
-from api.v1 import router as router_v1
+from platform_core.app import create_app
+from platform_core.ledger import sender_router
 
+from core.config import config
 
-def configure_application() -> FastAPI:
-    setup_logger()
+from api.v1 import forwarder, router as router_v1
 
-    app = FastAPI(
-        title=config.APP_NAME,
-        middleware=[Middleware(LoggerTracingMiddleware)],
-    )
-    app.include_router(router_v1)
 
-    setup_observability(
-        app=app,
-        service_name=config.APP_NAME,
-        otel_endpoint=config.OPENTELEMETRY_ENDRPOIND,
-    )
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.batcher = forwarder.build_batcher(app.state.http_client)
 
-    return app
+    try:
+        yield
+    finally:
+        if app.state.batcher is not None:
+            await app.state.batcher.close()
 
 
-app = configure_application()
+app = create_app(config, routers=[router_v1, sender_router], lifespan=lifespan, http_client=True)
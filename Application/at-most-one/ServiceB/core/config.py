@@ -1,9 +1,13 @@
-from pydantic_settings import BaseSettings
+from platform_core.config import PlatformConfig
+from platform_core.faults import Fault, FaultProfile
 
 
-class Config(BaseSettings):
-    APP_NAME: str
-    OPENTELEMETRY_ENDRPOIND: str
+class Config(PlatformConfig):
+    ADMISSION_PATH_PREFIX: str = "/api/message-b"
+
+    FAULTS_PROFILE: FaultProfile = FaultProfile(
+        faults=[Fault(probability=0.35, status_code=502, detail="some error")],
+    )
 
 
 config: Config = Config()
@@ -0,0 +1,137 @@
+"""
+Benchmarks the delivery variants against local ServiceA / ServiceB processes
+
+    cd Application
+    python -m benchmark --variant all --rate 100 --duration 30 --output results.json
+
+Each variant gets fresh uvicorn processes, so the `/stats` counters read after
+the run cover exactly that run. Extra settings are passed with `--env`, e.g.
+`--env HEDGING_ENABLED=true` or `--service-b-env ADMISSION_ENABLED=true`.
+"""
+
+import sys
+import json
+import asyncio
+import argparse
+import tempfile
+import subprocess
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+import httpx
+
+from benchmark.load import constant_arrival_rate
+from benchmark.report import delivery_report
+from benchmark.services import APPLICATION_DIR, VARIANTS, running_variant
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmark", description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--variant", choices=[*VARIANTS, "all"], default="all")
+    parser.add_argument("--rate", type=float, default=50.0, help="requests per second offered to ServiceA")
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds of load per variant")
+    parser.add_argument("--max-in-flight", type=int, default=1000)
+    parser.add_argument("--timeout", type=float, default=30.0, help="client timeout per request")
+    parser.add_argument("--drain", type=float, default=5.0, help="seconds to wait for late deliveries before reading /stats")
+    parser.add_argument("--env", action="append", default=[], metavar="KEY=VALUE", help="setting for both services")
+    parser.add_argument("--service-a-env", action="append", default=[], metavar="KEY=VALUE")
+    parser.add_argument("--service-b-env", action="append", default=[], metavar="KEY=VALUE")
+    parser.add_argument("--work-dir", type=Path, help="where service logs and SQLite files go (default: a temporary directory)")
+    parser.add_argument("--output", type=Path, help="write the JSON report here instead of stdout")
+    return parser.parse_args(argv)
+
+
+def parse_env(pairs: list[str]) -> dict[str, str]:
+    env = {}
+    for pair in pairs:
+        key, separator, value = pair.partition("=")
+        if not separator:
+            raise SystemExit(f"Expected KEY=VALUE, got {pair!r}")
+        env[key] = value
+    return env
+
+
+async def run_variant(variant: str, args: argparse.Namespace, work_dir: Path) -> dict:
+    shared_env = parse_env(args.env)
+    limits = httpx.Limits(max_connections=args.max_in_flight, max_keepalive_connections=args.max_in_flight)
+
+    async with httpx.AsyncClient(limits=limits) as client:
+        async with running_variant(
+            variant,
+            client,
+            work_dir=work_dir,
+            service_a_env={**shared_env, **parse_env(args.service_a_env)},
+            service_b_env={**shared_env, **parse_env(args.service_b_env)},
+        ) as (service_a, service_b):
+            load = await constant_arrival_rate(
+                client,
+                f"{service_a.url}/api/message-a",
+                rate=args.rate,
+                duration=args.duration,
+                max_in_flight=args.max_in_flight,
+                timeout=args.timeout,
+            )
+            await asyncio.sleep(args.drain)
+
+            stats_a = await service_a.stats(client)
+            stats_b = await service_b.stats(client)
+
+            sender = await service_a.get(client, "/ledger")
+            receipts = await service_b.get(client, "/ledger", epoch=sender["epoch"], issued=sender["issued"])
+
+    return {
+        "load": load.summary(),
+        "delivery": delivery_report(variant, load, stats_a, stats_b, receipts[sender["epoch"]]),
+        "stats": {"service_a": stats_a, "service_b": stats_b},
+    }
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=APPLICATION_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def main(argv: list[str]) -> None:
+    args = parse_args(argv)
+    variants = VARIANTS if args.variant == "all" else (args.variant,)
+
+    with tempfile.TemporaryDirectory(prefix="benchmark-") as temp_dir:
+        work_dir = args.work_dir or Path(temp_dir)
+        work_dir.mkdir(parents=True, exist_ok=True)
+
+        results = {variant: await run_variant(variant, args, work_dir) for variant in variants}
+
+    report = {
+        "revision": git_revision(),
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "parameters": {
+            "rate": args.rate,
+            "duration": args.duration,
+            "max_in_flight": args.max_in_flight,
+            "timeout": args.timeout,
+            "drain": args.drain,
+            "env": args.env,
+            "service_a_env": args.service_a_env,
+            "service_b_env": args.service_b_env,
+        },
+        "variants": results,
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.output is None:
+        print(output)
+    else:
+        args.output.write_text(output + "\n")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(sys.argv[1:]))
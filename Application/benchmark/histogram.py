@@ -0,0 +1,57 @@
+import math
+
+
+class LatencyHistogram:
+    """
+    Log-linear latency histogram in the spirit of HdrHistogram
+
+    Values are kept in buckets whose width is at most `1 / 10 ** significant_digits`
+    of their value, so percentiles are accurate to that relative precision no
+    matter how wide the recorded range is.
+    """
+
+    def __init__(self, *, significant_digits: int = 2, lowest_value: float = 1e-6) -> None:
+        self.lowest_value = lowest_value
+        self._log_base = math.log1p(10 ** -significant_digits)
+        self._buckets: dict[int, int] = {}
+
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        index = int(math.log(max(value, self.lowest_value) / self.lowest_value) / self._log_base)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def percentile(self, percentile: float) -> float:
+        if not self.count:
+            return 0.0
+
+        rank = max(1, math.ceil(self.count * percentile / 100))
+        seen = 0
+
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                # Upper edge of the bucket, never above the largest recorded value.
+                return min(self.max, self.lowest_value * math.exp((index + 1) * self._log_base))
+
+        return self.max
+
+    def summary(self, percentiles: tuple[float, ...] = (50, 90, 95, 99, 99.9)) -> dict:
+        if not self.count:
+            return {"count": 0}
+
+        return {
+            "count": self.count,
+            "min": self.min,
+            "mean": self.total / self.count,
+            "max": self.max,
+            **{f"p{p:g}": self.percentile(p) for p in percentiles},
+        }
@@ -0,0 +1,99 @@
+import time
+import asyncio
+
+import httpx
+
+from benchmark.histogram import LatencyHistogram
+
+
+class LoadResult:
+    def __init__(self) -> None:
+        self.latency = LatencyHistogram()
+        self.error_latency = LatencyHistogram()
+        self.status_codes: dict[str, int] = {}
+        self.scheduled = 0
+        self.skipped = 0
+        self.elapsed = 0.0
+
+    def record(self, outcome: str, latency: float) -> None:
+        self.status_codes[outcome] = self.status_codes.get(outcome, 0) + 1
+        self.latency.record(latency)
+        if outcome != "200":
+            self.error_latency.record(latency)
+
+    @property
+    def acknowledged(self) -> int:
+        return self.status_codes.get("200", 0)
+
+    def summary(self) -> dict:
+        completed = sum(self.status_codes.values())
+
+        return {
+            "scheduled": self.scheduled,
+            "skipped": self.skipped,
+            "completed": completed,
+            "acknowledged": self.acknowledged,
+            "elapsed_seconds": self.elapsed,
+            "throughput_rps": completed / self.elapsed if self.elapsed else 0.0,
+            "goodput_rps": self.acknowledged / self.elapsed if self.elapsed else 0.0,
+            "responses": self.status_codes,
+            "latency_seconds": self.latency.summary(),
+            "error_latency_seconds": self.error_latency.summary(),
+        }
+
+
+async def constant_arrival_rate(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    rate: float,
+    duration: float,
+    max_in_flight: int,
+    timeout: float,
+) -> LoadResult:
+    """
+    Open-loop load: request `i` is started at `i / rate` seconds whether or not earlier ones have finished
+
+    Latency is measured from the scheduled start, so a stalled generator shows up
+    as latency instead of silently lowering the offered rate. Every outcome is
+    timed, timeouts and transport errors included, and failed requests are also
+    kept in a separate histogram. Requests that would exceed `max_in_flight` are
+    skipped and counted.
+    """
+
+    result = LoadResult()
+    in_flight: set[asyncio.Task] = set()
+    total = int(rate * duration)
+    started_at = time.perf_counter()
+
+    async def send(index: int, scheduled_at: float) -> None:
+        try:
+            response = await client.post(url, json={"message": f"benchmark-{index}"}, timeout=timeout)
+        except httpx.TimeoutException:
+            outcome = "timeout"
+        except httpx.TransportError as e:
+            outcome = type(e).__name__
+        else:
+            outcome = str(response.status_code)
+
+        result.record(outcome, time.perf_counter() - scheduled_at)
+
+    for index in range(total):
+        scheduled_at = started_at + index / rate
+        if (delay := scheduled_at - time.perf_counter()) > 0:
+            await asyncio.sleep(delay)
+
+        result.scheduled += 1
+        if len(in_flight) >= max_in_flight:
+            result.skipped += 1
+            continue
+
+        task = asyncio.create_task(send(index, scheduled_at))
+        in_flight.add(task)
+        task.add_done_callback(in_flight.discard)
+
+    if in_flight:
+        await asyncio.gather(*in_flight)
+
+    result.elapsed = time.perf_counter() - started_at
+    return result
@@ -0,0 +1,54 @@
+from benchmark.load import LoadResult
+
+
+# Receiver outcome under which each variant's ServiceB counts a message as processed.
+PROCESSED_OUTCOME = {
+    "at-most-one": "accepted",
+    "at-least-one": "succeeded",
+    "exactly-once": "processed",
+}
+
+
+def delivery_report(variant: str, load: LoadResult, stats_a: dict, stats_b: dict, ledger: dict) -> dict:
+    """
+    Retry amplification from the `/stats` snapshots and delivery guarantees from ServiceB's ledger
+
+    The ledger covers every message ServiceA stamped during the run, so the
+    delivered-once, duplicated and missing counts are exact, not inferred.
+    """
+
+    requests = _total(stats_a.get("forwarder.requests"))
+    attempts = _total(stats_a.get("forwarder.attempts"))
+    received = stats_b.get("receiver.requests") or {}
+    issued = ledger["expected"]
+
+    return {
+        "acknowledged_to_client": load.acknowledged,
+        "issued": issued,
+        "processed_by_service_b": _outcome(received, PROCESSED_OUTCOME[variant]),
+        "attempts_towards_service_b": attempts,
+        "retry_amplification": attempts / requests if requests else None,
+        "hedges": _total(stats_a.get("forwarder.hedges")),
+        "delivered_once": ledger["delivered_once"],
+        "duplicated": ledger["duplicated"],
+        "duplicate_receipts": ledger["duplicate_receipts"],
+        "missing": ledger["missing"],
+        "exactly_once_rate": ledger["delivered_once"] / issued if issued else None,
+        "duplicate_rate": ledger["duplicated"] / issued if issued else None,
+        "loss_rate": ledger["missing"] / issued if issued else None,
+        "deduplicated_at_service_b": _outcome(received, "duplicate"),
+        "receiver_outcomes": received,
+        "faults_injected": stats_b.get("faults.injected", 0),
+    }
+
+
+def _total(counter: int | dict | None) -> int:
+    if isinstance(counter, dict):
+        return counter.get("total", 0)
+    return counter or 0
+
+
+def _outcome(counter: int | dict, outcome: str) -> int:
+    if isinstance(counter, dict):
+        return counter.get(outcome, 0)
+    return 0
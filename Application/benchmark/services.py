@@ -0,0 +1,143 @@
+import os
+import sys
+import socket
+import asyncio
+import subprocess
+
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import httpx
+
+
+APPLICATION_DIR = Path(__file__).resolve().parent.parent
+PLATFORM_CORE_DIR = APPLICATION_DIR / "platform-core"
+
+VARIANTS = ("at-most-one", "at-least-one", "exactly-once")
+
+# Keep the services independent of an OpenTelemetry collector.
+BASE_ENV = {
+    "OPENTELEMETRY_ENDRPOIND": "http://127.0.0.1:4317",
+    "METRICS_EXPORTER": "prometheus",
+    "TRACING_SAMPLE_RATIO": "0",
+    "LOG_FORMAT": "json",
+}
+
+
+class ServiceProcess:
+    """
+    One service of a variant served by a local uvicorn subprocess
+    """
+
+    def __init__(self, variant: str, service: str, *, env: dict[str, str], log_path: Path) -> None:
+        self.variant = variant
+        self.service = service
+        self.port = _free_port()
+        self.url = f"http://127.0.0.1:{self.port}"
+        self.env = env
+        self.log_path = log_path
+
+        self._process: subprocess.Popen | None = None
+        self._log_file = None
+
+    def start(self) -> None:
+        service_dir = APPLICATION_DIR / self.variant / self.service
+        python_path = os.pathsep.join(filter(None, [str(PLATFORM_CORE_DIR), os.environ.get("PYTHONPATH")]))
+
+        self._log_file = open(self.log_path, "wb")
+        self._process = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(self.port)],
+            cwd=service_dir,
+            env={**os.environ, "PYTHONPATH": python_path, **BASE_ENV, **self.env},
+            stdout=self._log_file,
+            stderr=subprocess.STDOUT,
+        )
+
+    async def wait_ready(self, client: httpx.AsyncClient, timeout: float = 30.0) -> None:
+        deadline = asyncio.get_running_loop().time() + timeout
+
+        while asyncio.get_running_loop().time() < deadline:
+            if self._process.poll() is not None:
+                raise RuntimeError(f"{self.variant}/{self.service} exited, see {self.log_path}")
+
+            try:
+                if (await client.get(f"{self.url}/stats")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+
+            await asyncio.sleep(0.1)
+
+        raise TimeoutError(f"{self.variant}/{self.service} did not start within {timeout}s, see {self.log_path}")
+
+    async def get(self, client: httpx.AsyncClient, path: str, **params) -> dict:
+        response = await client.get(f"{self.url}{path}", params=params)
+        response.raise_for_status()
+        return response.json()
+
+    async def stats(self, client: httpx.AsyncClient) -> dict:
+        return await self.get(client, "/stats")
+
+    def stop(self) -> None:
+        if self._process is not None and self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+
+        if self._log_file is not None:
+            self._log_file.close()
+
+
+@asynccontextmanager
+async def running_variant(
+    variant: str,
+    client: httpx.AsyncClient,
+    *,
+    work_dir: Path,
+    service_a_env: dict[str, str],
+    service_b_env: dict[str, str],
+):
+    """
+    Starts ServiceB, then ServiceA pointed at it, and yields both once they answer
+    """
+
+    service_b = ServiceProcess(
+        variant,
+        "ServiceB",
+        env={
+            "APP_NAME": "service-b",
+            "IDEMPOTENCY_SQLITE_PATH": str(work_dir / f"{variant}-idempotency.sqlite3"),
+            **service_b_env,
+        },
+        log_path=work_dir / f"{variant}-service-b.log",
+    )
+    service_a = ServiceProcess(
+        variant,
+        "ServiceA",
+        env={
+            "APP_NAME": "service-a",
+            "SERVICE_B_URL": service_b.url,
+            "OUTBOX_PATH": str(work_dir / f"{variant}-outbox.sqlite3"),
+            **service_a_env,
+        },
+        log_path=work_dir / f"{variant}-service-a.log",
+    )
+
+    try:
+        service_b.start()
+        await service_b.wait_ready(client)
+        service_a.start()
+        await service_a.wait_ready(client)
+
+        yield service_a, service_b
+    finally:
+        service_a.stop()
+        service_b.stop()
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
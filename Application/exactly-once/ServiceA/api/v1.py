@@ -1,23 +1,26 @@
+import uuid
 import httpx
 import logging
-import uuid
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from opentelemetry import metrics
 from pydantic import BaseModel
-from tenacity import AsyncRetrying, stop_after_attempt, wait_fixed
+
+from platform_core.batcher import MicroBatcher, get_batcher
+from platform_core.client import get_http_client
+from platform_core.forwarder import build_forwarder
+from platform_core.ledger import stamper
+from platform_core.stats import StatsCounter
 
 from core.config import config
 
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
-_stats = {
-    "total_requests": 0,
-    "total_http_attempts": 0,
-    "total_retries": 0,
-    "succeeded_requests": 0,
-    "failed_requests": 0,
-}
+meter = metrics.get_meter(__name__)
+
+forwarder = build_forwarder(config)
+_requests = StatsCounter(meter, "forwarder.requests", description="Messages accepted for forwarding, by outcome")
 
 
 class Message(BaseModel):
@@ -25,38 +28,22 @@ class Message(BaseModel):
 
 
 @router.post("/api/message-a")
-async def accept_and_forward(payload: Message):
-    _stats["total_requests"] += 1
-    attempt_number = 0
-    attempt_count = 3
-
+async def accept_and_forward(
+    payload: Message,
+    client: httpx.AsyncClient = Depends(get_http_client),
+    batcher: MicroBatcher | None = Depends(get_batcher),
+) -> dict:
     idempotency_key = str(uuid.uuid4())
+    message = stamper.stamp(payload.model_dump())
+    outcome = "failed"
 
     try:
-        async for attempt in AsyncRetrying(
-            stop=stop_after_attempt(attempt_count),
-            wait=wait_fixed(0.2),
-            reraise=True,
-        ):
-            attempt_number += 1
-            _stats["total_http_attempts"] += 1
-
-            with attempt:
-                async with httpx.AsyncClient(timeout=1) as client:
-                    response = await client.post(
-                        f"{config.SERVICE_B_URL}/api/message-b",
-                        json=payload.model_dump(),
-                        headers={"Idempotency-Key": idempotency_key},
-                    )
-
-        _stats["succeeded_requests"] += 1
-
-    except Exception:
-        _stats["failed_requests"] += 1
-
+        attempts = await forwarder.forward(client, batcher, message, idempotency_key=idempotency_key)
+        outcome = "succeeded"
+        logger.debug("Message succeeded after %d attempt(s)", attempts)
+    except Exception as e:
+        logger.warning("Delivery failed: %r", e)
     finally:
-        retries_made = max(attempt_number - 1, 0)
-        _stats["total_retries"] += retries_made
-        logger.info("%s", _stats)
+        _requests.add(outcome=outcome)
 
     return {"result": "ok"}
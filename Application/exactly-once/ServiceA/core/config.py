@@ -1,10 +1,8 @@
-from pydantic_settings import BaseSettings
+from platform_core.config import ForwarderConfig
 
 
-class Config(BaseSettings):
-    APP_NAME: str
-    SERVICE_B_URL: str
-    OPENTELEMETRY_ENDRPOIND: str
+class Config(ForwarderConfig):
+    pass
 
 
 config: Config = Config()
@@ -1,58 +1,44 @@
-import logging
-import asyncio
-import random
-
-from fastapi import APIRouter, HTTPException, Header
+from fastapi import APIRouter, Depends, Header
 from pydantic import BaseModel
 
+from platform_core.faults import FaultEngine, get_fault_engine
+from platform_core.receiver import BatchItem as BaseBatchItem, Message, Receiver
+from platform_core.serialization import CodecRoute
+
+from core.idempotency import InFlightRegistry, get_in_flight_registry
+
+
+router = APIRouter(route_class=CodecRoute)
+receiver = Receiver(outcome="processed")
 
-logger = logging.getLogger(__name__)
-router = APIRouter()
 
-_idempotency_store: dict[str, dict] = {}
-_idempotency_lock = asyncio.Lock()
-_stats = {
-    "total_requests": 0,
-    "unique_processed": 0,
-    "duplicate_hits": 0,
-    "failed_requests": 0,
-}
+class BatchItem(BaseBatchItem):
+    idempotency_key: str
 
 
-class Message(BaseModel):
-    message: str
+class MessageBatch(BaseModel):
+    messages: list[BatchItem]
 
 
 @router.post("/api/message-b")
 async def receive_message(
     payload: Message,
     idempotency_key: str = Header(alias="Idempotency-Key"),
-):
-    async with _idempotency_lock:
-        _stats["total_requests"] += 1
-        if (cached := _idempotency_store.get(idempotency_key)) is not None:
-            _stats["duplicate_hits"] += 1
-            logger.info("%s", _stats)
-            return cached
-
-    r = random.random()
-
-    if r < 0.20:
-        delay_s = random.uniform(1.2, 3.5)
-        await asyncio.sleep(delay_s)
-
-    elif r < 0.30:
-        async with _idempotency_lock:
-            _stats["failed_requests"] += 1
-            logger.info("%s", _stats)
-        raise HTTPException(status_code=500, detail="Random failure")
+    in_flight: InFlightRegistry = Depends(get_in_flight_registry),
+    faults: FaultEngine = Depends(get_fault_engine),
+) -> dict:
+    return await receiver.receive(faults, payload, deduplicate=in_flight.execute, idempotency_key=idempotency_key)
 
-    result = {"status": "ok"}
 
-    async with _idempotency_lock:
-        _idempotency_store[idempotency_key] = result
-        _stats["unique_processed"] += 1
+@router.post("/api/message-b/batch")
+async def receive_batch(
+    batch: MessageBatch,
+    in_flight: InFlightRegistry = Depends(get_in_flight_registry),
+    faults: FaultEngine = Depends(get_fault_engine),
+) -> dict:
+    return await receiver.receive_batch(faults, batch.messages, deduplicate=in_flight.execute)
 
-    logger.info("%s", _stats)
 
-    return result
+@router.get("/api/idempotency/stats")
+async def idempotency_stats(in_flight: InFlightRegistry = Depends(get_in_flight_registry)) -> dict:
+    return await in_flight.stats()
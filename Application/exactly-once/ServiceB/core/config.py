@@ -1,9 +1,25 @@
-from pydantic_settings import BaseSettings
+from typing import Literal
 
+from platform_core.config import PlatformConfig
+from platform_core.faults import Fault, FaultProfile, Latency
 
-class Config(BaseSettings):
-    APP_NAME: str
-    OPENTELEMETRY_ENDRPOIND: str
+
+class Config(PlatformConfig):
+    IDEMPOTENCY_BACKEND: Literal["memory", "sqlite"] = "memory"
+    IDEMPOTENCY_TTL_SECONDS: float = 3600.0
+    IDEMPOTENCY_MAX_ENTRIES: int = 100_000
+    IDEMPOTENCY_SQLITE_PATH: str = "/data/idempotency.sqlite3"
+    IDEMPOTENCY_BATCH_MAX_SIZE: int = 128
+    IDEMPOTENCY_BATCH_MAX_DELAY_MS: float = 2.0
+
+    ADMISSION_PATH_PREFIX: str = "/api/message-b"
+
+    FAULTS_PROFILE: FaultProfile = FaultProfile(
+        faults=[
+            Fault(probability=0.2, latency=Latency(distribution="uniform", low=1.2, high=3.5)),
+            Fault(probability=0.1, status_code=500, detail="Random failure"),
+        ],
+    )
 
 
 config: Config = Config()
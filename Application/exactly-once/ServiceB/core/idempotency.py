@@ -0,0 +1,414 @@
+import json
+import time
+import asyncio
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import partial
+from typing import Awaitable, Callable
+
+from fastapi import Request
+
+from platform_core.sqlite import SqliteExecutor
+
+
+class IdempotencyStore(ABC):
+    """
+    Results of processed deliveries keyed by Idempotency-Key
+    """
+
+    async def open(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    @abstractmethod
+    async def get(self, key: str) -> dict | None:
+        ...
+
+    @abstractmethod
+    async def put_if_absent(self, key: str, result: dict) -> tuple[dict, bool]:
+        """
+        Stores `result` unless a live entry exists; returns the stored result and whether it was created
+        """
+
+    @abstractmethod
+    async def stats(self) -> dict:
+        ...
+
+
+class InMemoryIdempotencyStore(IdempotencyStore):
+    """
+    LRU-bounded idempotency results with a fixed retention window
+    """
+
+    def __init__(self, *, ttl_seconds: float, max_entries: int) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    async def get(self, key: str) -> dict | None:
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self._misses += 1
+            return None
+
+        expires_at, result = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self._expirations += 1
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return result
+
+    async def put_if_absent(self, key: str, result: dict) -> tuple[dict, bool]:
+        now = time.monotonic()
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            self._entries.move_to_end(key)
+            return entry[1], False
+
+        self._entries[key] = (now + self._ttl_seconds, result)
+        self._entries.move_to_end(key)
+
+        # Expired entries are mostly the least recently used ones, so the
+        # front of the ordering is trimmed first and at most one live entry
+        # is evicted per insert.
+        while self._entries:
+            oldest_key, (expires_at, _) = next(iter(self._entries.items()))
+            if expires_at > now:
+                break
+            del self._entries[oldest_key]
+            self._expirations += 1
+
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+        return result, True
+
+    async def stats(self) -> dict:
+        lookups = self._hits + self._misses
+
+        return {
+            "backend": "memory",
+            "size": len(self._entries),
+            "max_entries": self._max_entries,
+            "ttl_seconds": self._ttl_seconds,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_ratio": self._hits / lookups if lookups else 0.0,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+        }
+
+
+class SqliteIdempotencyStore(IdempotencyStore):
+    """
+    Idempotency results in a WAL-mode SQLite file shared by every worker process
+
+    Writes are group-committed: concurrent `put_if_absent` calls are collected
+    for up to `batch_max_delay_ms` and stored in one transaction, and every
+    caller returns only after its batch is durable.
+    """
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS idempotency ("
+        " key TEXT PRIMARY KEY,"
+        " result TEXT NOT NULL,"
+        " expires_at REAL NOT NULL"
+        ") WITHOUT ROWID",
+        # The table is clustered on key; expiry lookups and purges use this index.
+        "CREATE INDEX IF NOT EXISTS idempotency_expires_at ON idempotency (expires_at)",
+    )
+
+    def __init__(
+        self,
+        *,
+        path: str,
+        ttl_seconds: float,
+        batch_max_size: int = 128,
+        batch_max_delay_ms: float = 2.0,
+        purge_interval_seconds: float = 60.0,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._batch_max_size = batch_max_size
+        self._batch_max_delay = batch_max_delay_ms / 1000
+        self._purge_interval_seconds = purge_interval_seconds
+
+        self._db = SqliteExecutor(path, schema=self.SCHEMA, thread_name_prefix="idempotency-sqlite")
+        self._pending: list[tuple[str, dict, asyncio.Future]] = []
+        self._pending_event = asyncio.Event()
+        self._writer: asyncio.Task | None = None
+        self._last_purge = 0.0
+
+        self._hits = 0
+        self._misses = 0
+        self._conflicts = 0
+        self._batches = 0
+        self._batched_writes = 0
+        self._expirations = 0
+
+    async def open(self) -> None:
+        await self._db.open()
+        self._writer = asyncio.create_task(self._write_loop())
+
+    async def close(self) -> None:
+        """
+        Stops the writer and stores every pending result before closing the connection
+        """
+
+        if self._writer is not None:
+            self._writer.cancel()
+            try:
+                await self._writer
+            except asyncio.CancelledError:
+                pass
+
+        while self._pending:
+            await self._flush()
+
+        await self._db.close()
+
+    async def get(self, key: str) -> dict | None:
+        row = await self._db.run(self._select, key, time.time())
+
+        if row is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        return json.loads(row[0])
+
+    async def put_if_absent(self, key: str, result: dict) -> tuple[dict, bool]:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((key, result, future))
+        self._pending_event.set()
+
+        return await future
+
+    async def stats(self) -> dict:
+        size = await self._db.run(self._count, time.time())
+        lookups = self._hits + self._misses
+
+        return {
+            "backend": "sqlite",
+            "size": size,
+            "ttl_seconds": self._ttl_seconds,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_ratio": self._hits / lookups if lookups else 0.0,
+            "conflicts": self._conflicts,
+            "batches": self._batches,
+            "avg_batch_size": self._batched_writes / self._batches if self._batches else 0.0,
+            "expirations": self._expirations,
+        }
+
+    async def _write_loop(self) -> None:
+        while True:
+            await self._pending_event.wait()
+
+            if len(self._pending) < self._batch_max_size:
+                await asyncio.sleep(self._batch_max_delay)
+
+            await self._flush()
+
+    async def _flush(self) -> None:
+        batch = self._pending[:self._batch_max_size]
+        del self._pending[:self._batch_max_size]
+        if not self._pending:
+            self._pending_event.clear()
+
+        write = asyncio.ensure_future(self._db.run(self._write_batch, [(key, result) for key, result, _ in batch]))
+        try:
+            await asyncio.shield(write)
+        except asyncio.CancelledError:
+            # The batch is already off `_pending` and its write goes on in the
+            # executor; its callers are answered once the write lands.
+            write.add_done_callback(partial(self._settle, batch))
+            raise
+        except Exception:
+            pass
+
+        self._settle(batch, write)
+
+    def _settle(self, batch: list[tuple[str, dict, asyncio.Future]], write: asyncio.Future) -> None:
+        if (error := write.exception()) is not None:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        self._batches += 1
+        self._batched_writes += len(batch)
+
+        for (_, _, future), outcome in zip(batch, write.result()):
+            if not outcome[1]:
+                self._conflicts += 1
+            if not future.done():
+                future.set_result(outcome)
+
+    def _select(self, key: str, now: float) -> tuple | None:
+        return self._db.connection.execute(
+            "SELECT result FROM idempotency WHERE key = ? AND expires_at > ?",
+            (key, now),
+        ).fetchone()
+
+    def _count(self, now: float) -> int:
+        return self._db.connection.execute(
+            "SELECT COUNT(*) FROM idempotency WHERE expires_at > ?",
+            (now,),
+        ).fetchone()[0]
+
+    def _write_batch(self, batch: list[tuple[str, dict]]) -> list[tuple[dict, bool]]:
+        now = time.time()
+        expires_at = now + self._ttl_seconds
+        outcomes = []
+
+        cursor = self._db.connection.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            for key, result in batch:
+                # An expired row is replaced, a live one written by another
+                # worker wins and is returned instead.
+                cursor.execute(
+                    "INSERT INTO idempotency (key, result, expires_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT (key) DO UPDATE SET result = excluded.result, expires_at = excluded.expires_at "
+                    "WHERE idempotency.expires_at <= ?",
+                    (key, json.dumps(result), expires_at, now),
+                )
+                if cursor.rowcount:
+                    outcomes.append((result, True))
+                else:
+                    row = cursor.execute("SELECT result FROM idempotency WHERE key = ?", (key,)).fetchone()
+                    outcomes.append((json.loads(row[0]), False))
+
+            if now - self._last_purge >= self._purge_interval_seconds:
+                cursor.execute("DELETE FROM idempotency WHERE expires_at <= ?", (now,))
+                self._expirations += cursor.rowcount
+                self._last_purge = now
+
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+
+        return outcomes
+
+
+class InFlightRegistry:
+    """
+    Per-key futures for deliveries that are still being processed
+
+    A duplicate that arrives while its key is in flight waits for that delivery
+    instead of looking the key up in the store; `stats` counts it as `coalesced`
+    and as a hit.
+    """
+
+    def __init__(self, store: IdempotencyStore) -> None:
+        self.store = store
+        self._in_flight: dict[str, asyncio.Future] = {}
+        self._coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
+
+    async def stats(self) -> dict:
+        stats = await self.store.stats()
+        hits = stats["hits"] + self._coalesced
+        lookups = hits + stats["misses"]
+
+        return {
+            **stats,
+            "hit_ratio": hits / lookups if lookups else 0.0,
+            "coalesced": self._coalesced,
+            "in_flight": len(self._in_flight),
+        }
+
+    async def execute(self, key: str, func: Callable[[], Awaitable[dict]]) -> tuple[dict, bool]:
+        """
+        Returns the result for `key` and whether it was produced by an earlier delivery
+        """
+
+        while True:
+            pending = self._in_flight.get(key)
+
+            if pending is None:
+                if (cached := await self.store.get(key)) is not None:
+                    return cached, True
+                # Another delivery of the key may have started during the lookup.
+                if key not in self._in_flight:
+                    break
+                continue
+
+            try:
+                result = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+            except Exception:
+                # The first delivery failed without storing a result, so this
+                # one is free to take over the key.
+                pass
+            else:
+                self._coalesced += 1
+                return result, True
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+
+        try:
+            result = await func()
+            # Another worker process may have committed the same key meanwhile.
+            result, created = await self.store.put_if_absent(key, result)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved when nobody else is waiting.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result, not created
+        finally:
+            del self._in_flight[key]
+
+
+def build_idempotency_store(
+    *,
+    backend: str,
+    ttl_seconds: float,
+    max_entries: int,
+    sqlite_path: str,
+    batch_max_size: int,
+    batch_max_delay_ms: float,
+) -> IdempotencyStore:
+    if backend == "memory":
+        return InMemoryIdempotencyStore(ttl_seconds=ttl_seconds, max_entries=max_entries)
+
+    if backend == "sqlite":
+        return SqliteIdempotencyStore(
+            path=sqlite_path,
+            ttl_seconds=ttl_seconds,
+            batch_max_size=batch_max_size,
+            batch_max_delay_ms=batch_max_delay_ms,
+        )
+
+    raise ValueError(f"Unknown idempotency backend: {backend}")
+
+
+def get_in_flight_registry(request: Request) -> InFlightRegistry:
+    return request.app.state.in_flight
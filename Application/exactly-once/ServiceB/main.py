@@ -1,30 +1,33 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from fastapi.middleware import Middleware
 
-from core.logging import setup_logger
-from core.opentelemetry import setup_observability
+from platform_core.app import create_app
+from platform_core.ledger import receiver_router
+
 from core.config import config
-from core.middleware import LoggerTracingMiddleware
+from core.idempotency import InFlightRegistry, build_idempotency_store
 
 from api.v1 import router as router_v1
 
 
-def configure_application() -> FastAPI:
-    setup_logger()
-
-    app = FastAPI(
-        title=config.APP_NAME,
-        middleware=[Middleware(LoggerTracingMiddleware)],
-    )
-    app.include_router(router_v1)
-
-    setup_observability(
-        app=app,
-        service_name=config.APP_NAME,
-        otel_endpoint=config.OPENTELEMETRY_ENDRPOIND,
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    store = build_idempotency_store(
+        backend=config.IDEMPOTENCY_BACKEND,
+        ttl_seconds=config.IDEMPOTENCY_TTL_SECONDS,
+        max_entries=config.IDEMPOTENCY_MAX_ENTRIES,
+        sqlite_path=config.IDEMPOTENCY_SQLITE_PATH,
+        batch_max_size=config.IDEMPOTENCY_BATCH_MAX_SIZE,
+        batch_max_delay_ms=config.IDEMPOTENCY_BATCH_MAX_DELAY_MS,
     )
+    await store.open()
+    app.state.in_flight = InFlightRegistry(store)
 
-    return app
+    try:
+        yield
+    finally:
+        await store.close()
 
 
-app = configure_application()
+app = create_app(config, routers=[router_v1, receiver_router], lifespan=lifespan, fault_injection=True)
@@ -0,0 +1,7 @@
+import sys
+
+from pathlib import Path
+
+
+# The service is run from its own directory, where `core` is a top-level package.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,144 @@
+import time
+import asyncio
+
+import pytest
+
+from core.idempotency import InFlightRegistry, InMemoryIdempotencyStore, SqliteIdempotencyStore
+
+
+def make_registry() -> InFlightRegistry:
+    return InFlightRegistry(InMemoryIdempotencyStore(ttl_seconds=60, max_entries=100))
+
+
+def test_concurrent_duplicates_coalesce_onto_the_first_delivery():
+    async def scenario():
+        registry = make_registry()
+        calls = 0
+
+        async def process():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"result": "ok"}
+
+        outcomes = await asyncio.gather(*(registry.execute("key", process) for _ in range(5)))
+
+        assert calls == 1
+        assert outcomes[0] == ({"result": "ok"}, False)
+        assert outcomes[1:] == [({"result": "ok"}, True)] * 4
+
+        stats = await registry.stats()
+        assert stats["coalesced"] == 4
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == pytest.approx(0.8)
+        assert len(registry) == 0
+
+    asyncio.run(scenario())
+
+
+def test_a_waiting_duplicate_takes_over_when_the_first_delivery_fails():
+    async def scenario():
+        registry = make_registry()
+        started = asyncio.Event()
+
+        async def failing():
+            started.set()
+            await asyncio.sleep(0.01)
+            raise RuntimeError("processing failed")
+
+        async def succeeding():
+            return {"result": "ok"}
+
+        first = asyncio.create_task(registry.execute("key", failing))
+        await started.wait()
+        second = asyncio.create_task(registry.execute("key", succeeding))
+
+        with pytest.raises(RuntimeError):
+            await first
+        assert await second == ({"result": "ok"}, False)
+
+        # The stored result now answers later duplicates.
+        assert await registry.execute("key", failing) == ({"result": "ok"}, True)
+
+    asyncio.run(scenario())
+
+
+def test_a_later_duplicate_is_answered_from_the_store():
+    async def scenario():
+        registry = make_registry()
+
+        async def process():
+            return {"result": "ok"}
+
+        assert await registry.execute("key", process) == ({"result": "ok"}, False)
+        assert await registry.execute("key", process) == ({"result": "ok"}, True)
+        assert (await registry.stats())["hits"] == 1
+
+    asyncio.run(scenario())
+
+
+@pytest.fixture
+def sqlite_path(tmp_path):
+    return str(tmp_path / "idempotency.sqlite3")
+
+
+def test_concurrent_writes_are_group_committed(sqlite_path):
+    async def scenario():
+        store = SqliteIdempotencyStore(path=sqlite_path, ttl_seconds=60, batch_max_size=8, batch_max_delay_ms=5)
+        await store.open()
+        try:
+            outcomes = await asyncio.gather(*(store.put_if_absent(f"key-{i}", {"i": i}) for i in range(20)))
+            stats = await store.stats()
+        finally:
+            await store.close()
+
+        assert outcomes == [({"i": i}, True) for i in range(20)]
+        assert stats["size"] == 20
+        assert stats["batches"] < 20
+
+    asyncio.run(scenario())
+
+
+def test_an_existing_key_keeps_its_first_result(sqlite_path):
+    async def scenario():
+        store = SqliteIdempotencyStore(path=sqlite_path, ttl_seconds=60)
+        await store.open()
+        try:
+            assert await store.put_if_absent("key", {"attempt": 1}) == ({"attempt": 1}, True)
+            assert await store.put_if_absent("key", {"attempt": 2}) == ({"attempt": 1}, False)
+            assert await store.get("key") == {"attempt": 1}
+        finally:
+            await store.close()
+
+    asyncio.run(scenario())
+
+
+def test_close_drains_every_pending_write(sqlite_path):
+    async def scenario():
+        store = SqliteIdempotencyStore(path=sqlite_path, ttl_seconds=60, batch_max_size=4, batch_max_delay_ms=50)
+        await store.open()
+
+        write_batch = store._write_batch
+
+        def slow_write_batch(batch):
+            # Keeps the first batch in the executor while close() cancels the writer.
+            time.sleep(0.05)
+            return write_batch(batch)
+
+        store._write_batch = slow_write_batch
+
+        writes = [asyncio.create_task(store.put_if_absent(f"key-{i}", {"i": i})) for i in range(10)]
+        await asyncio.sleep(0.06)
+        await store.close()
+
+        outcomes = await asyncio.wait_for(asyncio.gather(*writes), 1)
+        assert outcomes == [({"i": i}, True) for i in range(10)]
+
+        reopened = SqliteIdempotencyStore(path=sqlite_path, ttl_seconds=60)
+        await reopened.open()
+        try:
+            assert (await reopened.stats())["size"] == 10
+        finally:
+            await reopened.close()
+
+    asyncio.run(scenario())
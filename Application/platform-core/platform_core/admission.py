@@ -0,0 +1,248 @@
+import math
+import time
+import asyncio
+
+from abc import ABC, abstractmethod
+from collections import deque
+
+from opentelemetry import metrics
+from opentelemetry.metrics import CallbackOptions, Observation
+
+from platform_core.deadline import get_remaining
+from platform_core.stats import StatsCounter
+
+
+meter = metrics.get_meter(__name__)
+
+_controllers: list["AdmissionController"] = []
+_rejected = StatsCounter(
+    meter,
+    "admission.rejected",
+    unit="{request}",
+    description="Requests shed by admission control, by reason",
+)
+_queue_wait = meter.create_histogram(
+    "admission.queue.wait",
+    unit="s",
+    description="Time admitted requests spent waiting for a concurrency slot",
+)
+
+
+class ConcurrencyLimit(ABC):
+    """
+    Number of requests allowed in flight, adjusted from the outcome of finished requests
+    """
+
+    def __init__(self, *, initial_limit: int, min_limit: int, max_limit: int) -> None:
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self._limit = float(initial_limit)
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @abstractmethod
+    def update(self, latency: float, in_flight: int, dropped: bool) -> None:
+        ...
+
+    def _set(self, limit: float) -> None:
+        self._limit = min(self.max_limit, max(self.min_limit, limit))
+
+
+class FixedLimit(ConcurrencyLimit):
+    def update(self, latency: float, in_flight: int, dropped: bool) -> None:
+        pass
+
+
+class AIMDLimit(ConcurrencyLimit):
+    """
+    Grows by one while the limit is in use and shrinks by `backoff_ratio` on a drop or a latency above `latency_threshold`
+    """
+
+    def __init__(self, *, latency_threshold: float, backoff_ratio: float = 0.9, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.latency_threshold = latency_threshold
+        self.backoff_ratio = backoff_ratio
+
+    def update(self, latency: float, in_flight: int, dropped: bool) -> None:
+        if dropped or latency > self.latency_threshold:
+            self._set(self._limit * self.backoff_ratio)
+        elif in_flight * 2 >= self.limit:
+            self._set(self._limit + 1)
+
+
+class GradientLimit(ConcurrencyLimit):
+    """
+    Scales the limit by the ratio of the long-term average latency to the current one
+
+    A latency that rises above `tolerance` times the long-term average shrinks
+    the limit, down to half of it per sample. Otherwise it grows by a queue of
+    `sqrt(limit)`, as long as at least half of it is in use.
+    """
+
+    def __init__(
+        self,
+        *,
+        smoothing: float = 0.2,
+        tolerance: float = 1.5,
+        long_window: int = 600,
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.smoothing = smoothing
+        self.tolerance = tolerance
+        self.long_window = long_window
+
+        self._long_latency: float | None = None
+        self._samples = 0
+
+    def update(self, latency: float, in_flight: int, dropped: bool) -> None:
+        self._samples += 1
+
+        if self._long_latency is None:
+            self._long_latency = latency
+            return
+
+        factor = 2 / (min(self._samples, self.long_window) + 1)
+        self._long_latency += factor * (latency - self._long_latency)
+
+        if in_flight * 2 < self.limit and not dropped:
+            return
+
+        if dropped:
+            gradient = 0.5
+        else:
+            gradient = max(0.5, min(1.0, self.tolerance * self._long_latency / max(latency, 1e-6)))
+
+        new_limit = self._limit * gradient + math.sqrt(self._limit)
+        self._set((1 - self.smoothing) * self._limit + self.smoothing * new_limit)
+
+
+class AdmissionController:
+    """
+    Admits up to `limit.limit` concurrent requests and queues at most `max_queue` more for `queue_timeout`
+    """
+
+    def __init__(self, limit: ConcurrencyLimit, *, max_queue: int, queue_timeout: float) -> None:
+        self.limit = limit
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+
+        self.in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+
+        _controllers.append(self)
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> bool:
+        """
+        Waits for a concurrency slot; False means the request has to be shed
+        """
+
+        if self.in_flight < self.limit.limit and not self._waiters:
+            self.in_flight += 1
+            return True
+
+        if len(self._waiters) >= self.max_queue:
+            _rejected.add(outcome="queue_full")
+            return False
+
+        timeout = self.queue_timeout
+        if (remaining := get_remaining()) is not None:
+            timeout = min(timeout, max(remaining, 0))
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        started_at = time.perf_counter()
+
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was granted just as the wait ended; pass it on.
+                self.in_flight -= 1
+                self._wake_waiters()
+            else:
+                self._discard(waiter)
+
+            if isinstance(e, TimeoutError):
+                _rejected.add(outcome="queue_timeout")
+                return False
+            raise
+
+        _queue_wait.record(time.perf_counter() - started_at)
+        return True
+
+    def release(self, latency: float, dropped: bool) -> None:
+        self.limit.update(latency, self.in_flight, dropped)
+        self.in_flight -= 1
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self.in_flight < self.limit.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def _discard(self, waiter: asyncio.Future) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+
+def build_admission_controller(
+    *,
+    strategy: str,
+    initial_limit: int,
+    min_limit: int,
+    max_limit: int,
+    latency_threshold: float,
+    max_queue: int,
+    queue_timeout: float,
+) -> AdmissionController:
+    bounds = {"initial_limit": initial_limit, "min_limit": min_limit, "max_limit": max_limit}
+
+    if strategy == "fixed":
+        limit = FixedLimit(**bounds)
+    elif strategy == "aimd":
+        limit = AIMDLimit(latency_threshold=latency_threshold, **bounds)
+    elif strategy == "gradient":
+        limit = GradientLimit(**bounds)
+    else:
+        raise ValueError(f"Unknown admission strategy: {strategy}")
+
+    return AdmissionController(limit, max_queue=max_queue, queue_timeout=queue_timeout)
+
+
+def _observe(value):
+    def callback(options: CallbackOptions):
+        for controller in _controllers:
+            yield Observation(value(controller))
+
+    return callback
+
+
+meter.create_observable_gauge(
+    "admission.limit",
+    callbacks=[_observe(lambda controller: controller.limit.limit)],
+    unit="{request}",
+    description="Current concurrency limit",
+)
+meter.create_observable_gauge(
+    "admission.in_flight",
+    callbacks=[_observe(lambda controller: controller.in_flight)],
+    unit="{request}",
+    description="Requests holding a concurrency slot",
+)
+meter.create_observable_gauge(
+    "admission.queue.depth",
+    callbacks=[_observe(lambda controller: controller.queue_depth)],
+    unit="{request}",
+    description="Requests waiting for a concurrency slot",
+)
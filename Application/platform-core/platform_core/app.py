@@ -0,0 +1,154 @@
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from functools import partial
+from typing import Callable, Sequence
+
+from fastapi import APIRouter, FastAPI
+from fastapi.middleware import Middleware
+
+from platform_core.admission import build_admission_controller
+from platform_core.client import build_http_client
+from platform_core.config import PlatformConfig
+from platform_core.faults import FaultEngine, router as faults_router
+from platform_core.logging import setup_logger, start_log_listener, stop_log_listener
+from platform_core.middleware import AdmissionMiddleware, DeadlineMiddleware, FaultMiddleware, LoggerTracingMiddleware
+from platform_core.opentelemetry import setup_observability
+from platform_core.serialization import require_orjson
+from platform_core.stats import router as stats_router
+
+
+Lifespan = Callable[[FastAPI], AbstractAsyncContextManager]
+
+
+def create_app(
+    config: PlatformConfig,
+    *,
+    routers: Sequence[APIRouter],
+    lifespan: Lifespan | None = None,
+    http_client: bool = False,
+    fault_injection: bool = False,
+) -> FastAPI:
+    """
+    FastAPI application with the platform's logging, middleware, `/stats` route and observability
+
+    With `http_client` a pooled `httpx.AsyncClient` is kept in `app.state.http_client`
+    for the lifetime of the application; the service's own `lifespan` runs inside it.
+    With `fault_injection` a `FaultEngine` built from `FAULTS_PROFILE` is kept in
+    `app.state.fault_engine`, and `/admin/faults` switches it live unless disabled.
+    Responses are rendered by pydantic from the handlers' return annotations;
+    `SERIALIZATION_FAST_JSON` only switches the bodies sent to other services to orjson.
+    """
+
+    if config.SERIALIZATION_FAST_JSON:
+        require_orjson()
+
+    setup_logger(
+        log_format=config.LOG_FORMAT,
+        handler=config.LOG_HANDLER,
+        queue_size=config.LOG_QUEUE_SIZE,
+        queue_policy=config.LOG_QUEUE_POLICY,
+        queue_block_timeout=config.LOG_QUEUE_BLOCK_TIMEOUT,
+        sampling=config.LOG_SAMPLING,
+    )
+
+    app = FastAPI(
+        title=config.APP_NAME,
+        middleware=build_middleware(config, fault_injection=fault_injection),
+        lifespan=partial(_platform_lifespan, config=config, http_client=http_client, lifespan=lifespan),
+    )
+    for router in routers:
+        app.include_router(router)
+    app.include_router(stats_router)
+
+    app.state.fault_engine = None
+    if fault_injection:
+        app.state.fault_engine = FaultEngine(config.FAULTS_PROFILE, seed=config.FAULTS_SEED)
+        if config.FAULTS_ADMIN_ENABLED:
+            app.include_router(faults_router)
+
+    setup_observability(
+        app=app,
+        service_name=config.APP_NAME,
+        otel_endpoint=config.OPENTELEMETRY_ENDRPOIND,
+        metrics_exporter=config.METRICS_EXPORTER,
+        tracing_options={
+            "sample_ratio": config.TRACING_SAMPLE_RATIO,
+            "tail_sampling": config.TRACING_TAIL_SAMPLING,
+            "tail_slow_threshold": config.TRACING_TAIL_SLOW_THRESHOLD,
+            "tail_max_traces": config.TRACING_TAIL_MAX_TRACES,
+            "export_queue_size": config.TRACING_EXPORT_QUEUE_SIZE,
+            "export_batch_size": config.TRACING_EXPORT_BATCH_SIZE,
+            "export_delay_millis": config.TRACING_EXPORT_DELAY_MILLIS,
+            "export_timeout_millis": config.TRACING_EXPORT_TIMEOUT_MILLIS,
+        },
+        metrics_options={
+            "export_interval_millis": config.METRICS_EXPORT_INTERVAL_MILLIS,
+            "temporality": config.METRICS_TEMPORALITY,
+            "histogram_aggregation": config.METRICS_HISTOGRAM_AGGREGATION,
+            "histogram_boundaries": config.METRICS_HISTOGRAM_BOUNDARIES,
+            "exponential_max_size": config.METRICS_EXPONENTIAL_MAX_SIZE,
+            "exemplar_filter": config.METRICS_EXEMPLAR_FILTER,
+        },
+    )
+
+    return app
+
+
+def build_middleware(config: PlatformConfig, *, fault_injection: bool = False) -> list[Middleware]:
+    middleware = [Middleware(DeadlineMiddleware, default_timeout=config.REQUEST_DEFAULT_TIMEOUT)]
+
+    if config.ADMISSION_ENABLED:
+        controller = build_admission_controller(
+            strategy=config.ADMISSION_STRATEGY,
+            initial_limit=config.ADMISSION_INITIAL_LIMIT,
+            min_limit=config.ADMISSION_MIN_LIMIT,
+            max_limit=config.ADMISSION_MAX_LIMIT,
+            latency_threshold=config.ADMISSION_LATENCY_THRESHOLD,
+            max_queue=config.ADMISSION_QUEUE_SIZE,
+            queue_timeout=config.ADMISSION_QUEUE_TIMEOUT,
+        )
+        middleware.append(
+            Middleware(
+                AdmissionMiddleware,
+                controller=controller,
+                path_prefix=config.ADMISSION_PATH_PREFIX,
+                retry_after=config.ADMISSION_RETRY_AFTER,
+            )
+        )
+
+    middleware.append(Middleware(LoggerTracingMiddleware))
+
+    if fault_injection:
+        middleware.append(Middleware(FaultMiddleware))
+
+    return middleware
+
+
+@asynccontextmanager
+async def _platform_lifespan(
+    app: FastAPI,
+    *,
+    config: PlatformConfig,
+    http_client: bool,
+    lifespan: Lifespan | None,
+):
+    start_log_listener()
+
+    app.state.http_client = None
+    if http_client:
+        app.state.http_client = build_http_client(
+            max_connections=config.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=config.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=config.HTTP_KEEPALIVE_EXPIRY,
+            http2=config.HTTP2_ENABLED,
+        )
+
+    try:
+        if lifespan is None:
+            yield
+        else:
+            async with lifespan(app):
+                yield
+    finally:
+        if app.state.http_client is not None:
+            await app.state.http_client.aclose()
+        stop_log_listener()
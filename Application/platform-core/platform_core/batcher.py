@@ -0,0 +1,109 @@
+import asyncio
+
+from typing import Awaitable, Callable, Generic, TypeVar
+
+from fastapi import Request
+from opentelemetry import metrics
+
+from platform_core.stats import StatsCounter
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+meter = metrics.get_meter(__name__)
+_batches = StatsCounter(meter, "forwarder.batches", unit="{batch}", description="Batches sent to ServiceB")
+_batch_size = meter.create_histogram(
+    "forwarder.batch.size",
+    unit="{message}",
+    description="Messages per batch sent to ServiceB",
+)
+
+
+class BatchItemError(Exception):
+    """
+    A single message of a batch was rejected by the upstream
+    """
+
+    def __init__(self, status_code: int, detail: str | None = None) -> None:
+        super().__init__(f"Batch item failed with status {status_code}: {detail}")
+        self.status_code = status_code
+        self.detail = detail
+
+
+class MicroBatcher(Generic[T, R]):
+    """
+    Coalesces submitted items into batches of up to `max_items`, waiting at most `max_delay_ms` for a batch to fill
+    """
+
+    def __init__(
+        self,
+        send_batch: Callable[[list[T]], Awaitable[list[R]]],
+        *,
+        max_items: int,
+        max_delay_ms: float,
+    ) -> None:
+        self.send_batch = send_batch
+        self.max_items = max_items
+        self.max_delay = max_delay_ms / 1000
+
+        self._pending: list[tuple[T, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._in_flight: set[asyncio.Task] = set()
+
+    async def submit(self, item: T) -> R:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_items:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._flush)
+
+        return await future
+
+    async def close(self) -> None:
+        self._flush()
+
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+
+        task = asyncio.create_task(self._send(batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _send(self, batch: list[tuple[T, asyncio.Future]]) -> None:
+        _batches.add()
+        _batch_size.record(len(batch))
+
+        try:
+            results = await self.send_batch([item for item, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+        # A short reply must not leave the remaining callers waiting forever.
+        for _, future in batch[len(results):]:
+            if not future.done():
+                future.set_exception(BatchItemError(502, "Missing from the batch response"))
+
+
+def get_batcher(request: Request) -> MicroBatcher | None:
+    return request.app.state.batcher
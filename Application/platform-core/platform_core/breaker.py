@@ -0,0 +1,189 @@
+import time
+import httpx
+import logging
+
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Callable
+
+from opentelemetry import metrics, trace
+from opentelemetry.metrics import CallbackOptions, Observation
+
+from platform_core.batcher import BatchItemError
+from platform_core.stats import StatsCounter
+
+
+logger = logging.getLogger(__name__)
+meter = metrics.get_meter(__name__)
+
+_breakers: list["CircuitBreaker"] = []
+_transitions = meter.create_counter(
+    "circuit_breaker.transitions",
+    unit="{transition}",
+    description="Circuit breaker state changes",
+)
+_rejected = StatsCounter(
+    meter,
+    "circuit_breaker.rejected",
+    unit="{call}",
+    description="Calls refused while a circuit breaker was open",
+)
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, name: str) -> None:
+        super().__init__(f"Circuit breaker for {name} is open")
+        self.name = name
+
+
+def is_upstream_failure(exception: BaseException) -> bool:
+    if isinstance(exception, httpx.HTTPStatusError):
+        return exception.response.status_code >= 500
+
+    if isinstance(exception, BatchItemError):
+        return exception.status_code >= 500
+
+    return isinstance(exception, httpx.TransportError)
+
+
+def is_upstream_response(exception: BaseException) -> bool:
+    return isinstance(exception, (httpx.HTTPStatusError, BatchItemError))
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open breaker driven by the failure rate of the last `window_size` calls
+
+    A call that raises counts as a failure when `is_failure` says so and as a
+    success when the upstream still answered (e.g. with a 4xx). Any other error,
+    such as the caller's deadline expiring, is not recorded at all.
+    """
+
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+
+    STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_rate_threshold: float = 0.5,
+        window_size: int = 20,
+        min_calls: int = 10,
+        open_seconds: float = 5.0,
+        half_open_max_calls: int = 1,
+        is_failure: Callable[[BaseException], bool] = is_upstream_failure,
+    ) -> None:
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self.is_failure = is_failure
+
+        self.state = self.CLOSED
+        self._outcomes: deque[bool] = deque(maxlen=window_size)
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self._attributes = {"upstream": name}
+
+        _breakers.append(self)
+
+    @asynccontextmanager
+    async def guard(self):
+        probe = self._acquire()
+
+        try:
+            yield
+        except Exception as e:
+            if self.is_failure(e):
+                self._on_failure()
+            elif is_upstream_response(e):
+                self._on_success()
+            raise
+        else:
+            self._on_success()
+        finally:
+            if probe:
+                self._probes_in_flight -= 1
+
+    def _acquire(self) -> bool:
+        if self.state == self.OPEN:
+            if time.monotonic() - self._opened_at < self.open_seconds:
+                self._reject()
+            self._transition(self.HALF_OPEN)
+
+        if self.state == self.HALF_OPEN:
+            if self._probes_in_flight >= self.half_open_max_calls:
+                self._reject()
+            self._probes_in_flight += 1
+            return True
+
+        return False
+
+    def _reject(self) -> None:
+        _rejected.add()
+        trace.get_current_span().add_event("circuit_breaker.rejected", self._attributes)
+        raise CircuitOpenError(self.name)
+
+    def _on_success(self) -> None:
+        if self.state == self.HALF_OPEN:
+            self._probe_successes += 1
+            if self._probe_successes >= self.half_open_max_calls:
+                self._transition(self.CLOSED)
+            return
+
+        self._record(False)
+
+    def _on_failure(self) -> None:
+        if self.state == self.HALF_OPEN:
+            self._transition(self.OPEN)
+            return
+
+        self._record(True)
+
+        if (
+            self.state == self.CLOSED
+            and len(self._outcomes) >= self.min_calls
+            and self._failures / len(self._outcomes) >= self.failure_rate_threshold
+        ):
+            self._transition(self.OPEN)
+
+    def _record(self, failed: bool) -> None:
+        if len(self._outcomes) == self._outcomes.maxlen and self._outcomes[0]:
+            self._failures -= 1
+
+        self._outcomes.append(failed)
+        self._failures += failed
+
+    def _transition(self, state: str) -> None:
+        previous, self.state = self.state, state
+
+        if state == self.OPEN:
+            self._opened_at = time.monotonic()
+        elif state == self.HALF_OPEN:
+            self._probe_successes = 0
+        elif state == self.CLOSED:
+            self._outcomes.clear()
+            self._failures = 0
+
+        attributes = {**self._attributes, "from": previous, "to": state}
+        _transitions.add(1, attributes)
+        trace.get_current_span().add_event("circuit_breaker.transition", attributes)
+        logger.warning("Circuit breaker for %s: %s -> %s", self.name, previous, state)
+
+
+def _observe_states(options: CallbackOptions):
+    for breaker in _breakers:
+        yield Observation(CircuitBreaker.STATE_VALUES[breaker.state], breaker._attributes)
+
+
+meter.create_observable_gauge(
+    "circuit_breaker.state",
+    callbacks=[_observe_states],
+    description="Circuit breaker state: 0 closed, 1 half-open, 2 open",
+)
@@ -0,0 +1,96 @@
+from typing import Literal
+
+from pydantic_settings import BaseSettings
+
+from platform_core.faults import FaultProfile
+
+
+class PlatformConfig(BaseSettings):
+    """
+    Settings read by `create_app`; each service extends it with its own
+    """
+
+    APP_NAME: str
+    OPENTELEMETRY_ENDRPOIND: str
+
+    TRACING_SAMPLE_RATIO: float = 1.0
+    TRACING_TAIL_SAMPLING: bool = False
+    TRACING_TAIL_SLOW_THRESHOLD: float = 1.0
+    TRACING_TAIL_MAX_TRACES: int = 10_000
+    TRACING_EXPORT_QUEUE_SIZE: int = 2048
+    TRACING_EXPORT_BATCH_SIZE: int = 512
+    TRACING_EXPORT_DELAY_MILLIS: int = 5000
+    TRACING_EXPORT_TIMEOUT_MILLIS: int = 30000
+
+    METRICS_EXPORTER: Literal["otlp", "prometheus"] = "otlp"
+    METRICS_EXPORT_INTERVAL_MILLIS: int = 1000
+    METRICS_TEMPORALITY: Literal["cumulative", "delta", "lowmemory"] = "cumulative"
+    METRICS_HISTOGRAM_AGGREGATION: Literal["explicit", "exponential"] = "explicit"
+    METRICS_HISTOGRAM_BOUNDARIES: dict[str, list[float]] = {}
+    METRICS_EXPONENTIAL_MAX_SIZE: int = 160
+    METRICS_EXEMPLAR_FILTER: Literal["trace_based", "always_on", "always_off"] = "trace_based"
+
+    LOG_FORMAT: Literal["color", "json"] = "color"
+    LOG_HANDLER: Literal["stream", "queue"] = "stream"
+    LOG_QUEUE_SIZE: int = 10_000
+    LOG_QUEUE_POLICY: Literal["drop", "block"] = "drop"
+    LOG_QUEUE_BLOCK_TIMEOUT: float = 1.0
+    LOG_SAMPLING: dict[str, dict[str, float]] = {}
+
+    REQUEST_DEFAULT_TIMEOUT: float | None = None
+
+    SERIALIZATION_FAST_JSON: bool = False
+
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_KEEPALIVE_EXPIRY: float = 5.0
+    HTTP2_ENABLED: bool = False
+
+    ADMISSION_ENABLED: bool = False
+    ADMISSION_STRATEGY: Literal["fixed", "aimd", "gradient"] = "fixed"
+    ADMISSION_INITIAL_LIMIT: int = 50
+    ADMISSION_MIN_LIMIT: int = 1
+    ADMISSION_MAX_LIMIT: int = 1000
+    ADMISSION_LATENCY_THRESHOLD: float = 1.0
+    ADMISSION_QUEUE_SIZE: int = 100
+    ADMISSION_QUEUE_TIMEOUT: float = 0.5
+    ADMISSION_PATH_PREFIX: str = "/api/"
+    ADMISSION_RETRY_AFTER: int = 1
+
+    FAULTS_PROFILE: FaultProfile = FaultProfile()
+    FAULTS_SEED: int | None = None
+    FAULTS_ADMIN_ENABLED: bool = True
+
+
+class ForwarderConfig(PlatformConfig):
+    """
+    Settings read by `build_forwarder` for services that forward messages to ServiceB
+    """
+
+    SERVICE_B_URL: str
+    SERVICE_B_WIRE_FORMAT: Literal["json", "msgpack"] = "json"
+    SERVICE_B_TIMEOUT: float = 1.0
+
+    BREAKER_ENABLED: bool = False
+    BREAKER_FAILURE_RATE: float = 0.5
+    BREAKER_WINDOW_SIZE: int = 20
+    BREAKER_MIN_CALLS: int = 10
+    BREAKER_OPEN_SECONDS: float = 5.0
+    BREAKER_HALF_OPEN_MAX_CALLS: int = 2
+
+    BATCH_ENABLED: bool = False
+    BATCH_MAX_ITEMS: int = 32
+    BATCH_MAX_DELAY_MS: float = 5.0
+    BATCH_TIMEOUT: float = 5.0
+
+    HEDGING_ENABLED: bool = False
+    HEDGING_PERCENTILE: float = 95.0
+    HEDGING_MIN_DELAY: float = 0.01
+    HEDGING_MAX_DELAY: float = 0.5
+
+    RETRY_MAX_ATTEMPTS: int = 3
+    RETRY_INITIAL_BACKOFF: float = 0.1
+    RETRY_MAX_BACKOFF: float = 2.0
+    RETRY_BUDGET_RATIO: float = 1.0
+    RETRY_BUDGET_MIN_PER_SECOND: float = 1.0
+    RETRY_BUDGET_WINDOW_SECONDS: int = 10
@@ -0,0 +1,124 @@
+import re
+import time
+import asyncio
+
+from contextvars import ContextVar, Token
+from typing import Awaitable, TypeVar
+
+
+T = TypeVar("T")
+
+DEADLINE_HEADER = "X-Request-Timeout"
+
+# grpc-timeout style values: up to 8 digits followed by a unit, e.g. `1500m`
+_TIMEOUT_PATTERN = re.compile(r"^(\d{1,8})([HMSmun])$")
+_TIMEOUT_UNITS = {"H": 3600.0, "M": 60.0, "S": 1.0, "m": 1e-3, "u": 1e-6, "n": 1e-9}
+
+_deadline: ContextVar[float | None] = ContextVar("_deadline", default=None)
+
+
+class DeadlineExceededError(Exception):
+    def __init__(self) -> None:
+        super().__init__("Request deadline exceeded")
+
+
+def parse_timeout(value: str) -> float | None:
+    """
+    Seconds encoded by a grpc-timeout style value, or None when the value is malformed
+    """
+
+    match = _TIMEOUT_PATTERN.match(value.strip())
+    if match is None:
+        return None
+
+    return int(match.group(1)) * _TIMEOUT_UNITS[match.group(2)]
+
+
+def format_timeout(seconds: float) -> str:
+    return f"{min(max(int(seconds * 1000), 0), 99_999_999)}m"
+
+
+def set_deadline(timeout: float) -> Token:
+    return _deadline.set(time.monotonic() + timeout)
+
+
+def reset_deadline(token: Token) -> None:
+    _deadline.reset(token)
+
+
+def get_remaining() -> float | None:
+    """
+    Seconds left until the deadline of the current request, None when it has no deadline
+    """
+
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+
+    return deadline - time.monotonic()
+
+
+def check_deadline() -> None:
+    remaining = get_remaining()
+    if remaining is not None and remaining <= 0:
+        raise DeadlineExceededError()
+
+
+def cap_timeout(timeout: float) -> float:
+    """
+    `timeout` shortened to the time left, raising once the deadline has passed
+    """
+
+    remaining = get_remaining()
+    if remaining is None:
+        return timeout
+
+    if remaining <= 0:
+        raise DeadlineExceededError()
+
+    return min(timeout, remaining)
+
+
+def get_deadline() -> float | None:
+    """
+    `time.monotonic()` instant at which the current request expires, None when it has no deadline
+    """
+
+    return _deadline.get()
+
+
+def deadline_headers(deadline: float | None = None) -> dict[str, str]:
+    """
+    Header propagating `deadline`, by default the current request's, to the next hop
+    """
+
+    if deadline is None:
+        deadline = _deadline.get()
+    if deadline is None:
+        return {}
+
+    return {DEADLINE_HEADER: format_timeout(deadline - time.monotonic())}
+
+
+async def wait_within_deadline(awaitable: Awaitable[T]) -> T:
+    remaining = get_remaining()
+    if remaining is None:
+        return await awaitable
+
+    try:
+        return await asyncio.wait_for(awaitable, max(remaining, 0))
+    except TimeoutError:
+        raise DeadlineExceededError() from None
+
+
+async def sleep_within_deadline(delay: float) -> None:
+    """
+    `asyncio.sleep` that gives up as soon as the deadline passes
+    """
+
+    remaining = get_remaining()
+    if remaining is not None and remaining < delay:
+        await asyncio.sleep(max(remaining, 0))
+        raise DeadlineExceededError()
+
+    await asyncio.sleep(delay)
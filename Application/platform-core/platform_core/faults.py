@@ -0,0 +1,281 @@
+import math
+import time
+import random
+import logging
+
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from opentelemetry import metrics
+from pydantic import BaseModel, Field, model_validator
+
+from platform_core.deadline import sleep_within_deadline
+from platform_core.stats import StatsCounter
+
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+meter = metrics.get_meter(__name__)
+
+_injected = StatsCounter(meter, "faults.injected", unit="{fault}", description="Injected faults, by kind")
+_injected_delay = meter.create_histogram(
+    "faults.injected_delay",
+    unit="s",
+    description="Injected processing delay",
+)
+
+
+class Latency(BaseModel):
+    """
+    Delay distribution; `high`, when set, caps the unbounded ones
+    """
+
+    distribution: Literal["fixed", "uniform", "exponential", "lognormal"] = "uniform"
+    low: float = 0.0
+    high: float | None = None
+    mean: float = 0.0
+    median: float = 0.0
+    sigma: float = 0.0
+
+    def sample(self, rng: random.Random) -> float:
+        match self.distribution:
+            case "fixed":
+                delay = self.low
+            case "uniform":
+                delay = rng.uniform(self.low, self.high or self.low)
+            case "exponential":
+                delay = self.low + rng.expovariate(1 / self.mean) if self.mean > 0 else self.low
+            case "lognormal":
+                delay = self.low + self.median * math.exp(self.sigma * rng.gauss(0.0, 1.0))
+
+        return delay if self.high is None else min(delay, self.high)
+
+
+class Fault(BaseModel):
+    """
+    Hits a message with `probability`: delays it by `latency`, then fails it with `status_code`, either or both
+    """
+
+    probability: float = Field(ge=0.0, le=1.0)
+    latency: Latency | None = None
+    status_code: int | None = None
+    detail: str = "Injected failure"
+
+
+class Outage(BaseModel):
+    """
+    Window of `duration` seconds starting `start` seconds into the schedule, repeated `every` seconds if set
+
+    Inside the window each message fails with `status_code` with `probability`,
+    so a probability below one models an error burst rather than a full outage.
+    """
+
+    start: float = 0.0
+    duration: float
+    every: float | None = None
+    probability: float = Field(default=1.0, ge=0.0, le=1.0)
+    status_code: int = 503
+    detail: str = "Injected outage"
+
+    def active(self, elapsed: float) -> bool:
+        if elapsed < self.start:
+            return False
+
+        offset = elapsed - self.start
+        if self.every:
+            offset %= self.every
+
+        return offset < self.duration
+
+
+class FaultProfile(BaseModel):
+    """
+    Declarative fault schedule for a receiving service
+
+    `faults` are mutually exclusive: a single draw picks at most one of them, so
+    their probabilities must sum to at most one. Outages take precedence over them,
+    and a connection reset (`reset_before_processing`) over both.
+
+    `drop_after_processing` is the chance that a message is processed and counted
+    but its reply is lost: answered with a 502 (`error`), cut off by closing the
+    connection (`abort`), or held for `stall_seconds` before closing it (`stall`),
+    which is meant to outlast the caller's timeout.
+    """
+
+    faults: list[Fault] = []
+    outages: list[Outage] = []
+    reset_before_processing: float = Field(default=0.0, ge=0.0, le=1.0)
+    drop_after_processing: float = Field(default=0.0, ge=0.0, le=1.0)
+    drop_mode: Literal["error", "abort", "stall"] = "error"
+    stall_seconds: float = 30.0
+
+    @model_validator(mode="after")
+    def _check_probabilities(self) -> "FaultProfile":
+        if sum(fault.probability for fault in self.faults) > 1.0:
+            raise ValueError("Fault probabilities must sum to at most 1")
+        return self
+
+
+class FaultSettings(BaseModel):
+    profile: FaultProfile
+    seed: int | None = None
+
+
+class InjectedFaultError(HTTPException):
+    pass
+
+
+class ResponseLostError(Exception):
+    """
+    Makes `FaultMiddleware` close the connection instead of replying, after `stall` seconds
+    """
+
+    def __init__(self, stall: float = 0.0) -> None:
+        super().__init__("Injected connection loss")
+        self.stall = stall
+
+
+class FaultDecision:
+    __slots__ = ("delay", "status_code", "detail", "reset", "drop_response", "kind")
+
+    def __init__(
+        self,
+        *,
+        delay: float = 0.0,
+        status_code: int | None = None,
+        detail: str = "",
+        reset: bool = False,
+        drop_response: bool = False,
+        kind: str | None = None,
+    ) -> None:
+        self.delay = delay
+        self.status_code = status_code
+        self.detail = detail
+        self.reset = reset
+        self.drop_response = drop_response
+        self.kind = kind
+
+
+class FaultEngine:
+    """
+    Decides the fate of each received message from a `FaultProfile` and a seeded RNG
+
+    Every decision consumes exactly one draw from the engine's RNG and makes the
+    rest from an RNG seeded with it, so with a fixed seed the n-th message gets
+    the same fate on every run whatever the profile's branches consume. The RNG
+    belongs to the engine, one per worker process, not to the `random` module.
+    Outages follow the wall clock from the moment the profile was configured.
+    """
+
+    def __init__(self, profile: FaultProfile, *, seed: int | None = None) -> None:
+        self.configure(profile, seed=seed)
+
+    def configure(self, profile: FaultProfile, *, seed: int | None = None) -> None:
+        self.profile = profile
+        self.seed = seed
+        self.decisions = 0
+        self._rng = random.Random(seed)
+        self._started_at = time.monotonic()
+
+        logger.info("Fault profile configured (seed=%s): %s", seed, profile.model_dump_json())
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self._started_at
+
+    def decide(self) -> FaultDecision:
+        rng = random.Random(self._rng.getrandbits(64))
+        self.decisions += 1
+
+        drop_response = rng.random() < self.profile.drop_after_processing
+
+        if rng.random() < self.profile.reset_before_processing:
+            return FaultDecision(reset=True, kind="reset")
+
+        elapsed = self.elapsed
+        for outage in self.profile.outages:
+            if outage.active(elapsed) and rng.random() < outage.probability:
+                return FaultDecision(
+                    status_code=outage.status_code,
+                    detail=outage.detail,
+                    drop_response=drop_response,
+                    kind="outage",
+                )
+
+        r = rng.random()
+        for fault in self.profile.faults:
+            if r < fault.probability:
+                return FaultDecision(
+                    delay=fault.latency.sample(rng) if fault.latency is not None else 0.0,
+                    status_code=fault.status_code,
+                    detail=fault.detail,
+                    drop_response=drop_response,
+                    kind="error" if fault.status_code is not None else "delay",
+                )
+            r -= fault.probability
+
+        return FaultDecision(drop_response=drop_response)
+
+    async def delay(self, decision: FaultDecision) -> None:
+        """
+        Applies the delay of a decision, which stands for a slow network or replica in front of the receiver
+        """
+
+        if decision.delay > 0:
+            _injected.add(outcome="delay")
+            _injected_delay.record(decision.delay)
+            await sleep_within_deadline(decision.delay)
+
+    async def inject(self, decision: FaultDecision) -> None:
+        """
+        Applies the reset and failure of a decision before the message is processed
+        """
+
+        if decision.reset:
+            _injected.add(outcome="reset")
+            raise ResponseLostError()
+
+        if decision.status_code is not None:
+            _injected.add(outcome=decision.kind)
+            raise InjectedFaultError(status_code=decision.status_code, detail=decision.detail)
+
+    def complete(self, decision: FaultDecision) -> None:
+        """
+        Called once the message is processed; loses the reply if the decision says so
+        """
+
+        if not decision.drop_response:
+            return
+
+        _injected.add(outcome="drop")
+        match self.profile.drop_mode:
+            case "error":
+                raise InjectedFaultError(status_code=502, detail="Injected response loss")
+            case "abort":
+                raise ResponseLostError()
+            case "stall":
+                raise ResponseLostError(stall=self.profile.stall_seconds)
+
+
+def get_fault_engine(request: Request) -> FaultEngine:
+    return request.app.state.fault_engine
+
+
+@router.get("/admin/faults")
+async def get_faults(engine: FaultEngine = Depends(get_fault_engine)) -> dict:
+    return {
+        "profile": engine.profile,
+        "seed": engine.seed,
+        "decisions": engine.decisions,
+        "elapsed": engine.elapsed,
+    }
+
+
+@router.put("/admin/faults")
+async def put_faults(settings: FaultSettings, engine: FaultEngine = Depends(get_fault_engine)) -> dict:
+    """
+    Reconfigures the engine of the worker that serves the request; other workers keep their profile
+    """
+
+    engine.configure(settings.profile, seed=settings.seed)
+    return {"profile": engine.profile, "seed": engine.seed}
@@ -0,0 +1,235 @@
+import time
+import httpx
+import asyncio
+
+from contextlib import nullcontext
+from functools import partial
+
+from opentelemetry import metrics
+
+from platform_core.batcher import BatchItemError, MicroBatcher
+from platform_core.breaker import CircuitBreaker
+from platform_core.config import ForwarderConfig
+from platform_core.deadline import cap_timeout, check_deadline, deadline_headers, get_deadline
+from platform_core.hedging import HedgingPolicy
+from platform_core.retry import RetryBudget, RetryPolicy
+from platform_core.serialization import Codec
+from platform_core.stats import StatsCounter
+
+
+meter = metrics.get_meter(__name__)
+
+_attempts = StatsCounter(meter, "forwarder.attempts", unit="{attempt}", description="HTTP attempts towards ServiceB")
+_retries = StatsCounter(meter, "forwarder.retries", unit="{attempt}", description="HTTP attempts beyond the first one")
+_delivery_duration = meter.create_histogram(
+    "forwarder.delivery.duration",
+    unit="s",
+    description="Time spent delivering a message to ServiceB, including retries",
+)
+
+
+class Forwarder:
+    """
+    Delivers messages to ServiceB's `/api/message-b`, singly or through the `MicroBatcher` from `build_batcher`
+
+    Each request to ServiceB goes through the circuit breaker, if any: a single
+    message per attempt, a batch once per POST whatever its size. `forward` adds
+    retries and hedging when the forwarder has a retry policy; without one a
+    message gets a single attempt. A batched attempt waits for its item no longer
+    than `timeout`, like a single POST. An `idempotency_key` travels as the
+    `Idempotency-Key` header, or as a field of the batch item. `batch_max_items`
+    of `None` disables batching.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        codec: Codec,
+        timeout: float,
+        batch_timeout: float,
+        batch_max_items: int | None,
+        batch_max_delay_ms: float,
+        breaker: CircuitBreaker | None = None,
+        retry_policy: RetryPolicy | None = None,
+        hedging: HedgingPolicy | None = None,
+    ) -> None:
+        self.url = url
+        self.codec = codec
+        self.timeout = timeout
+        self.batch_timeout = batch_timeout
+        self.batch_max_items = batch_max_items
+        self.batch_max_delay_ms = batch_max_delay_ms
+        self.breaker = breaker
+        self.retry_policy = retry_policy
+        self.hedging = hedging
+
+    async def forward(
+        self,
+        client: httpx.AsyncClient,
+        batcher: MicroBatcher | None,
+        message: dict,
+        *,
+        idempotency_key: str | None = None,
+    ) -> int:
+        """
+        Delivers `message`, raising the last error if it could not; returns the number of attempts
+        """
+
+        started_at = time.perf_counter()
+        attempt_number = 0
+        outcome = "failed"
+        send = partial(self.attempt, client, batcher, message, idempotency_key=idempotency_key)
+
+        try:
+            if self.retry_policy is None:
+                attempt_number = 1
+                await send()
+            else:
+                async for attempt in self.retry_policy.retrying():
+                    attempt_number += 1
+
+                    with attempt:
+                        check_deadline()
+
+                        if self.hedging is not None:
+                            await self.hedging.run(send)
+                        else:
+                            await send()
+
+            outcome = "succeeded"
+        finally:
+            _retries.add(max(attempt_number - 1, 0))
+            _delivery_duration.record(time.perf_counter() - started_at, {"outcome": outcome})
+
+        return attempt_number
+
+    async def attempt(
+        self,
+        client: httpx.AsyncClient,
+        batcher: MicroBatcher | None,
+        message: dict,
+        *,
+        idempotency_key: str | None = None,
+    ) -> None:
+        """
+        Single delivery attempt, on its own or as an item of the next batch
+        """
+
+        if batcher is not None:
+            _attempts.add()
+            item = message if idempotency_key is None else {**message, "idempotency_key": idempotency_key}
+            timeout = cap_timeout(self.timeout)
+
+            try:
+                result = await asyncio.wait_for(batcher.submit((item, get_deadline())), timeout)
+            except TimeoutError:
+                raise httpx.ReadTimeout(f"No batch result within {timeout:.3f}s") from None
+
+            if result["status_code"] >= 400:
+                raise BatchItemError(result["status_code"], result.get("detail"))
+            return
+
+        async with self._guard():
+            _attempts.add()
+            headers = {"Content-Type": self.codec.content_type, **deadline_headers()}
+            if idempotency_key is not None:
+                headers["Idempotency-Key"] = idempotency_key
+
+            response = await client.post(
+                f"{self.url}/api/message-b",
+                content=self.codec.encode(message),
+                headers=headers,
+                timeout=cap_timeout(self.timeout),
+            )
+            response.raise_for_status()
+
+    async def send_batch(self, client: httpx.AsyncClient, items: list[tuple[dict, float | None]]) -> list[dict]:
+        """
+        Posts a batch of `(message, deadline)` items collected by the `MicroBatcher` and returns the per-message results
+
+        The batch carries the earliest deadline of its items.
+        """
+
+        deadlines = [deadline for _, deadline in items if deadline is not None]
+        headers = {"Content-Type": self.codec.content_type}
+        if deadlines:
+            headers.update(deadline_headers(min(deadlines)))
+
+        async with self._guard():
+            response = await client.post(
+                f"{self.url}/api/message-b/batch",
+                content=self.codec.encode({"messages": [message for message, _ in items]}),
+                headers=headers,
+                timeout=self.batch_timeout,
+            )
+            response.raise_for_status()
+
+        return self.codec.decode_json(response.content)["results"]
+
+    def _guard(self):
+        return self.breaker.guard() if self.breaker is not None else nullcontext()
+
+    def build_batcher(self, client: httpx.AsyncClient) -> MicroBatcher | None:
+        if self.batch_max_items is None:
+            return None
+
+        return MicroBatcher(
+            partial(self.send_batch, client),
+            max_items=self.batch_max_items,
+            max_delay_ms=self.batch_max_delay_ms,
+        )
+
+
+def build_forwarder(config: ForwarderConfig, *, retries: bool = True) -> Forwarder:
+    """
+    Forwarder from the `ForwarderConfig` settings
+
+    Without `retries` there is neither a retry policy nor hedging, since both
+    may deliver a message more than once.
+    """
+
+    retry_policy = None
+    hedging = None
+    breaker = None
+
+    if retries:
+        retry_policy = RetryPolicy(
+            max_attempts=config.RETRY_MAX_ATTEMPTS,
+            initial_backoff=config.RETRY_INITIAL_BACKOFF,
+            max_backoff=config.RETRY_MAX_BACKOFF,
+            budget=RetryBudget(
+                ratio=config.RETRY_BUDGET_RATIO,
+                min_retries_per_second=config.RETRY_BUDGET_MIN_PER_SECOND,
+                window_seconds=config.RETRY_BUDGET_WINDOW_SECONDS,
+            ),
+        )
+
+        if config.HEDGING_ENABLED:
+            hedging = HedgingPolicy(
+                percentile=config.HEDGING_PERCENTILE,
+                min_delay=config.HEDGING_MIN_DELAY,
+                max_delay=config.HEDGING_MAX_DELAY,
+            )
+
+    if config.BREAKER_ENABLED:
+        breaker = CircuitBreaker(
+            config.SERVICE_B_URL,
+            failure_rate_threshold=config.BREAKER_FAILURE_RATE,
+            window_size=config.BREAKER_WINDOW_SIZE,
+            min_calls=config.BREAKER_MIN_CALLS,
+            open_seconds=config.BREAKER_OPEN_SECONDS,
+            half_open_max_calls=config.BREAKER_HALF_OPEN_MAX_CALLS,
+        )
+
+    return Forwarder(
+        config.SERVICE_B_URL,
+        codec=Codec(wire_format=config.SERVICE_B_WIRE_FORMAT, fast_json=config.SERIALIZATION_FAST_JSON),
+        timeout=config.SERVICE_B_TIMEOUT,
+        batch_timeout=config.BATCH_TIMEOUT,
+        batch_max_items=config.BATCH_MAX_ITEMS if config.BATCH_ENABLED else None,
+        batch_max_delay_ms=config.BATCH_MAX_DELAY_MS,
+        breaker=breaker,
+        retry_policy=retry_policy,
+        hedging=hedging,
+    )
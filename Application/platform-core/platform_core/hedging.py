@@ -0,0 +1,114 @@
+import time
+import asyncio
+
+from collections import deque
+from typing import Awaitable, Callable, TypeVar
+
+from opentelemetry import metrics, trace
+
+from platform_core.stats import StatsCounter
+
+
+T = TypeVar("T")
+
+meter = metrics.get_meter(__name__)
+_hedges = StatsCounter(
+    meter,
+    "forwarder.hedges",
+    unit="{request}",
+    description="Hedged copies sent to ServiceB, by whether they answered first",
+)
+
+
+class HedgingPolicy:
+    """
+    Sends a second copy of a call that has not answered within the `percentile` of recent latencies
+
+    The first successful answer wins and the other copy is cancelled. Until
+    `min_samples` latencies are known the delay is `max_delay`; after that the
+    percentile is recomputed every `refresh_every` samples rather than per call.
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: float,
+        min_delay: float,
+        max_delay: float,
+        window_size: int = 1000,
+        min_samples: int = 20,
+        refresh_every: int = 50,
+    ) -> None:
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.refresh_every = refresh_every
+
+        self._latencies: deque[float] = deque(maxlen=window_size)
+        self._delay = max_delay
+        self._stale_samples = 0
+
+    def delay(self) -> float:
+        return self._delay
+
+    def _record(self, latency: float) -> None:
+        self._latencies.append(latency)
+        self._stale_samples += 1
+
+        if len(self._latencies) < self.min_samples:
+            return
+        if self._stale_samples < self.refresh_every and len(self._latencies) > self.min_samples:
+            return
+
+        ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+
+        self._delay = min(self.max_delay, max(self.min_delay, ordered[index]))
+        self._stale_samples = 0
+
+    async def run(self, call: Callable[[], Awaitable[T]]) -> T:
+        primary = asyncio.ensure_future(call())
+        primary.add_done_callback(_retrieve_exception)
+        started_at = {primary: time.perf_counter()}
+        pending = {primary}
+        error: BaseException | None = None
+
+        try:
+            done, _ = await asyncio.wait(pending, timeout=self.delay())
+            if done:
+                return self._finish(primary, started_at[primary])
+
+            hedge = asyncio.ensure_future(call())
+            hedge.add_done_callback(_retrieve_exception)
+            started_at[hedge] = time.perf_counter()
+            pending.add(hedge)
+            trace.get_current_span().add_event("forwarder.hedge")
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    if task.exception() is None:
+                        _hedges.add(outcome="won" if task is hedge else "lost")
+                        return self._finish(task, started_at[task])
+
+                    error = error or task.exception()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        _hedges.add(outcome="failed")
+        raise error
+
+    def _finish(self, task: asyncio.Future, started_at: float):
+        result = task.result()
+        self._record(time.perf_counter() - started_at)
+        return result
+
+
+def _retrieve_exception(task: asyncio.Future) -> None:
+    # Both copies may finish in the same wakeup; the loser's error is deliberately
+    # ignored, so mark it retrieved instead of letting asyncio log it.
+    if not task.cancelled():
+        task.exception()
@@ -0,0 +1,160 @@
+import uuid
+import itertools
+
+from fastapi import APIRouter
+
+
+sender_router = APIRouter()
+receiver_router = APIRouter()
+
+
+class SequenceStamper:
+    """
+    Numbers the messages a sender emits, within an epoch unique to this process
+
+    The stamp travels in the message body (`sender_epoch`, `sequence_id`), so a
+    retry, hedge, batch or outbox redelivery of a message carries the same id.
+    """
+
+    def __init__(self) -> None:
+        self.epoch = uuid.uuid4().hex[:16]
+        self._sequence = itertools.count()
+        self.issued = 0
+
+    def stamp(self, message: dict) -> dict:
+        sequence_id = next(self._sequence)
+        self.issued = sequence_id + 1
+        return {**message, "sender_epoch": self.epoch, "sequence_id": sequence_id}
+
+
+class SequenceSet:
+    """
+    Set of non-negative integers kept as 2**16-bit bitmap chunks, allocated on first use as in a roaring bitmap
+
+    A million dense ids take 16 chunks of 8 KiB.
+    """
+
+    CHUNK_SHIFT = 16
+    CHUNK_BYTES = (1 << CHUNK_SHIFT) // 8
+
+    def __init__(self) -> None:
+        self._chunks: dict[int, bytearray] = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, value: int) -> bool:
+        chunk = self._chunks.get(value >> self.CHUNK_SHIFT)
+        if chunk is None:
+            return False
+
+        index, bit = divmod(value & ((1 << self.CHUNK_SHIFT) - 1), 8)
+        return bool(chunk[index] & (1 << bit))
+
+    def add(self, value: int) -> bool:
+        """
+        Adds `value` and returns whether it was not in the set yet
+        """
+
+        chunk = self._chunks.get(value >> self.CHUNK_SHIFT)
+        if chunk is None:
+            chunk = self._chunks[value >> self.CHUNK_SHIFT] = bytearray(self.CHUNK_BYTES)
+
+        index, bit = divmod(value & ((1 << self.CHUNK_SHIFT) - 1), 8)
+        mask = 1 << bit
+        if chunk[index] & mask:
+            return False
+
+        chunk[index] |= mask
+        self._count += 1
+        return True
+
+    @property
+    def memory_bytes(self) -> int:
+        return len(self._chunks) * self.CHUNK_BYTES
+
+
+class EpochLedger:
+    def __init__(self) -> None:
+        self.received = SequenceSet()
+        self.duplicated = SequenceSet()
+        self.duplicate_receipts = 0
+        self.highest = -1
+
+    def record(self, sequence_id: int) -> None:
+        if not self.received.add(sequence_id):
+            self.duplicate_receipts += 1
+            self.duplicated.add(sequence_id)
+
+        self.highest = max(self.highest, sequence_id)
+
+    def summary(self, issued: int | None = None) -> dict:
+        """
+        Without `issued` the missing ids are the gaps below the highest id received
+        """
+
+        expected = self.highest + 1 if issued is None else issued
+        received = len(self.received)
+        duplicated = len(self.duplicated)
+
+        return {
+            "expected": expected,
+            "received": received,
+            "delivered_once": received - duplicated,
+            "duplicated": duplicated,
+            "duplicate_receipts": self.duplicate_receipts,
+            "missing": max(expected - received, 0),
+            "memory_bytes": self.received.memory_bytes + self.duplicated.memory_bytes,
+        }
+
+
+class DeliveryLedger:
+    """
+    Receipts of stamped messages per sender epoch, kept by the receiving process
+
+    The ledger is process memory, so a receiver served by several workers reports
+    only the worker that answers `/ledger`; run one worker when reading it.
+    """
+
+    def __init__(self) -> None:
+        self._epochs: dict[str, EpochLedger] = {}
+
+    def record(self, sender_epoch: str | None, sequence_id: int | None) -> None:
+        if sender_epoch is None or sequence_id is None:
+            return
+
+        if (epoch := self._epochs.get(sender_epoch)) is None:
+            epoch = self._epochs[sender_epoch] = EpochLedger()
+
+        epoch.record(sequence_id)
+
+    def summary(self, issued: dict[str, int] | None = None) -> dict:
+        issued = issued or {}
+
+        return {
+            sender_epoch: epoch.summary(issued.get(sender_epoch))
+            for sender_epoch, epoch in self._epochs.items()
+        }
+
+
+stamper = SequenceStamper()
+ledger = DeliveryLedger()
+
+
+@sender_router.get("/ledger")
+async def sender_ledger() -> dict:
+    return {"epoch": stamper.epoch, "issued": stamper.issued}
+
+
+@receiver_router.get("/ledger")
+async def receiver_ledger(epoch: str | None = None, issued: int | None = None) -> dict:
+    """
+    Delivery counts per sender epoch; pass the sender's `epoch` and `issued` count to get exact missing ids
+    """
+
+    summary = ledger.summary({epoch: issued} if epoch is not None and issued is not None else None)
+    if epoch is not None:
+        return {epoch: summary.get(epoch, EpochLedger().summary(issued))}
+
+    return summary
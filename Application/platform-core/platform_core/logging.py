@@ -0,0 +1,407 @@
+import copy
+import json
+import queue
+import threading
+import time
+import logging.config
+import logging.handlers
+
+from contextvars import ContextVar, Token
+
+from opentelemetry import trace
+
+
+NO_TRACE = "-"
+
+_tracing_context: ContextVar["TracingContext | None"] = ContextVar("_tracing_context", default=None)
+_listener: logging.handlers.QueueListener | None = None
+_queue_handler: "BoundedQueueHandler | None" = None
+_sampling_filters: list["LogSamplingFilter"] = []
+_summary_timer: "SamplingSummaryTimer | None" = None
+
+
+class TracingContext:
+    """
+    Trace id of the current request, formatted from the active span the first time a record needs it
+    """
+
+    __slots__ = ("_value",)
+
+    def __init__(self) -> None:
+        self._value: str | None = None
+
+    def resolve(self) -> str:
+        if self._value is None:
+            # Not cached until a span is active, records logged before it get NO_TRACE.
+            if (value := _current_trace_id()) is None:
+                return NO_TRACE
+            self._value = value
+
+        return self._value
+
+
+def _current_trace_id() -> str | None:
+    span_context = trace.get_current_span().get_span_context()
+    return f"{span_context.trace_id:032x}" if span_context.is_valid else None
+
+
+def get_tracing_value() -> str:
+    if (context := _tracing_context.get()) is not None:
+        return context.resolve()
+
+    return _current_trace_id() or NO_TRACE
+
+
+def _record_tracing_value(record: logging.LogRecord):
+    # Records handed over by BoundedQueueHandler carry the value captured on the calling thread.
+    if not hasattr(record, "tracing_value"):
+        record.tracing_value = get_tracing_value()
+    return record.tracing_value
+
+
+class CustomLoggingFormatter(logging.Formatter):
+    """
+    Logging with ANSI color codes
+    """
+
+    format_header = "%(asctime)s - %(name)s - "
+    format_content = "%(message)s (%(filename)s:%(lineno)d) "
+    format_tracing = "[%(tracing_value)s]"
+
+    c_fg_black = "\x1b[30m"
+    c_fg_red = "\x1b[31m"
+    c_fg_green = "\x1b[32m"
+    c_fg_yellow = "\x1b[33m"
+    c_fg_blue = "\x1b[34m"
+    c_fg_magenta = "\x1b[35m"
+    c_fg_cyan = "\x1b[36m"
+    c_fg_white = "\x1b[37m"
+    c_fg_crimson = "\x1b[38m"
+    c_reset = "\x1b[0m"
+
+    FORMATS = {
+        logging.DEBUG: c_fg_magenta + format_header + c_fg_white + format_content + c_fg_cyan + format_tracing + c_reset,
+        logging.INFO: c_fg_magenta + format_header + c_reset + format_content + c_fg_cyan + format_tracing + c_reset,
+        logging.WARNING: c_fg_magenta + format_header + c_fg_yellow + format_content + c_fg_cyan + format_tracing + c_reset,
+        logging.ERROR: c_fg_magenta + format_header + c_fg_red + format_content + c_fg_cyan + format_tracing + c_reset,
+        logging.CRITICAL: c_fg_magenta + format_header + c_fg_red + format_content + c_fg_cyan + format_tracing + c_reset
+    }
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._default_formatter = logging.Formatter()
+        self._formatters = {level: logging.Formatter(log_fmt) for level, log_fmt in self.FORMATS.items()}
+
+    def format(self, record):
+        _record_tracing_value(record)
+        formatter = self._formatters.get(record.levelno, self._default_formatter)
+        return formatter.format(record)
+
+
+class JsonLoggingFormatter(logging.Formatter):
+    """
+    One JSON object per record, without ANSI color codes
+    """
+
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "location": f"{record.filename}:{record.lineno}",
+            "tracing": _record_tracing_value(record),
+        }
+
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+
+        return json.dumps(entry, ensure_ascii=False)
+
+
+LOGGING_CONFIG = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "base": {
+            '()': "platform_core.logging.CustomLoggingFormatter",
+        },
+        "json": {
+            '()': "platform_core.logging.JsonLoggingFormatter",
+        }
+    },
+    "handlers": {
+        "default": {
+            "level": "INFO",
+            "class": "logging.StreamHandler",
+            "formatter": "base"
+        }
+    },
+    "loggers": {
+        "": {
+            "handlers": ["default"],
+            "level": "INFO",
+            "propagate": False
+        },
+        "uvicorn.error": {
+            "disabled": True
+        },
+        "uvicorn.access": {
+            "disabled": True
+        },
+        "httpx": {
+            "level": "CRITICAL",
+            "handlers": [],
+            "propagate": True,
+            "disabled": True
+        },
+        "httpcore": {
+            "level": "CRITICAL",
+            "handlers": [],
+            "propagate": True,
+            "disabled": True
+        }
+    }
+}
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    Hands records over to a QueueListener thread, dropping or blocking when the queue is full
+    """
+
+    def __init__(self, log_queue: queue.Queue, *, block: bool = False, block_timeout: float | None = None) -> None:
+        super().__init__(log_queue)
+        self.block = block
+        self.block_timeout = block_timeout
+        self.dropped = 0
+
+    def prepare(self, record):
+        # Only the message and the tracing context are resolved on the calling
+        # thread; formatting is left to the listener's handler.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        record.tracing_value = get_tracing_value()
+        return record
+
+    def enqueue(self, record):
+        try:
+            if self.block:
+                self.queue.put(record, timeout=self.block_timeout)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LogSamplingFilter(logging.Filter):
+    """
+    Keeps every `every_n`-th record and at most `rate_per_second` records per second for each message,
+    periodically logging how many records were suppressed
+
+    A summary is due `summary_interval` seconds after the previous one and is
+    logged by the next record of that message or by `flush`, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        *,
+        every_n: int = 1,
+        rate_per_second: float | None = None,
+        summary_interval: float = 10.0,
+    ) -> None:
+        super().__init__()
+        self.every_n = max(int(every_n), 1)
+        self.rate_per_second = rate_per_second
+        self.summary_interval = summary_interval
+
+        self._lock = threading.Lock()
+        # (logger, message template) -> [seen, window start, kept in window, suppressed, last summary, last suppressed record]
+        self._states: dict[tuple[str, object], list] = {}
+
+    def filter(self, record):
+        if getattr(record, "sampling_summary", False):
+            return True
+
+        key = (record.name, record.msg)
+        now = time.monotonic()
+        summary = None
+
+        with self._lock:
+            if (state := self._states.get(key)) is None:
+                state = self._states[key] = [0, now, 0, 0, now, None]
+
+            state[0] += 1
+            keep = (state[0] - 1) % self.every_n == 0
+
+            if keep and self.rate_per_second is not None:
+                if now - state[1] >= 1.0:
+                    state[1] = now
+                    state[2] = 0
+                keep = state[2] < self.rate_per_second
+                if keep:
+                    state[2] += 1
+
+            if not keep:
+                state[3] += 1
+                state[5] = record
+
+            if state[3] and now - state[4] >= self.summary_interval:
+                summary = self._take_summary(state, now)
+
+        if summary is not None:
+            self._log_summary(*summary)
+
+        return keep
+
+    def flush(self, *, force: bool = False) -> None:
+        """
+        Logs the summaries that are due, or every pending one with `force`
+        """
+
+        now = time.monotonic()
+
+        with self._lock:
+            summaries = [
+                self._take_summary(state, now)
+                for state in self._states.values()
+                if state[3] and (force or now - state[4] >= self.summary_interval)
+            ]
+
+        for summary in summaries:
+            self._log_summary(*summary)
+
+    @staticmethod
+    def _take_summary(state: list, now: float) -> tuple[logging.LogRecord, int, float]:
+        summary = (state[5], state[3], now - state[4])
+        state[3] = 0
+        state[4] = now
+        state[5] = None
+        return summary
+
+    @staticmethod
+    def _log_summary(record: logging.LogRecord, suppressed: int, elapsed: float) -> None:
+        logger = logging.getLogger(record.name)
+        summary = logger.makeRecord(
+            record.name,
+            logging.INFO,
+            record.pathname,
+            record.lineno,
+            "Suppressed %d record(s) like %r in the last %.1fs",
+            (suppressed, record.msg, elapsed),
+            None,
+            extra={"sampling_summary": True},
+        )
+        logger.handle(summary)
+
+
+class SamplingSummaryTimer(threading.Thread):
+    """
+    Flushes the due sampling summaries every `interval` seconds, so a message that stops being logged still gets one
+    """
+
+    def __init__(self, interval: float) -> None:
+        super().__init__(name="log-sampling-summary", daemon=True)
+        self.interval = interval
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            flush_log_sampling()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.join()
+
+
+class DrainingQueueListener(logging.handlers.QueueListener):
+    def enqueue_sentinel(self):
+        # The queue may be full, wait for the listener thread to make room.
+        self.queue.put(self._sentinel)
+
+
+LOG_FORMATTERS = {
+    "color": "base",
+    "json": "json",
+}
+
+
+def setup_logger(
+    log_format: str = "color",
+    *,
+    handler: str = "stream",
+    queue_size: int = 10_000,
+    queue_policy: str = "drop",
+    queue_block_timeout: float = 1.0,
+    sampling: dict[str, dict] | None = None,
+):
+    global _listener, _queue_handler, _sampling_filters
+
+    logging_config = copy.deepcopy(LOGGING_CONFIG)
+    logging_config["handlers"]["default"]["formatter"] = LOG_FORMATTERS[log_format]
+
+    logging.config.dictConfig(config=logging_config)
+
+    _sampling_filters = []
+    for logger_name, rule in (sampling or {}).items():
+        sampling_filter = LogSamplingFilter(**rule)
+        logging.getLogger(logger_name).addFilter(sampling_filter)
+        _sampling_filters.append(sampling_filter)
+
+    if handler != "queue":
+        return
+
+    root = logging.getLogger()
+    log_queue = queue.Queue(maxsize=queue_size)
+
+    _queue_handler = BoundedQueueHandler(
+        log_queue,
+        block=queue_policy == "block",
+        block_timeout=queue_block_timeout,
+    )
+    _listener = DrainingQueueListener(log_queue, *root.handlers, respect_handler_level=True)
+
+    root.handlers = [_queue_handler]
+
+
+def start_log_listener() -> None:
+    global _summary_timer
+
+    if _listener is not None:
+        _listener.start()
+
+    if _sampling_filters:
+        _summary_timer = SamplingSummaryTimer(min(f.summary_interval for f in _sampling_filters))
+        _summary_timer.start()
+
+
+def stop_log_listener() -> None:
+    global _summary_timer
+
+    if _summary_timer is not None:
+        _summary_timer.stop()
+        _summary_timer = None
+
+    # Pending summaries go out before the listener drains the queue.
+    flush_log_sampling(force=True)
+
+    if _listener is not None:
+        _listener.stop()
+
+
+def flush_log_sampling(*, force: bool = False) -> None:
+    for sampling_filter in _sampling_filters:
+        sampling_filter.flush(force=force)
+
+
+def dropped_log_records() -> int:
+    return _queue_handler.dropped if _queue_handler is not None else 0
+
+
+def set_tracing_context() -> Token:
+    return _tracing_context.set(TracingContext())
+
+
+def reset_session_context(context: Token) -> None:
+    _tracing_context.reset(context)
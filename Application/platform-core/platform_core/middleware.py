@@ -0,0 +1,147 @@
+import time
+import asyncio
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from platform_core.admission import AdmissionController
+from platform_core.deadline import DEADLINE_HEADER, parse_timeout, reset_deadline, set_deadline
+from platform_core.faults import ResponseLostError
+from platform_core.logging import set_tracing_context, reset_session_context
+
+
+class LoggerTracingMiddleware:
+    """
+    Binds a tracing context to HTTP requests; the trace id is only formatted once a record is logged
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        context = set_tracing_context()
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            reset_session_context(context=context)
+
+
+class DeadlineMiddleware:
+    """
+    Binds the deadline of an HTTP request from its `X-Request-Timeout` header, or `default_timeout` without one
+    """
+
+    _header = DEADLINE_HEADER.lower().encode("latin-1")
+
+    def __init__(self, app: ASGIApp, default_timeout: float | None = None) -> None:
+        self.app = app
+        self.default_timeout = default_timeout
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        timeout = self._timeout(scope) if scope["type"] == "http" else None
+
+        if timeout is None:
+            await self.app(scope, receive, send)
+            return
+
+        token = set_deadline(timeout)
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            reset_deadline(token)
+
+    def _timeout(self, scope: Scope) -> float | None:
+        for name, value in scope["headers"]:
+            if name == self._header:
+                timeout = parse_timeout(value.decode("latin-1"))
+                if timeout is not None:
+                    return timeout if self.default_timeout is None else min(timeout, self.default_timeout)
+                break
+
+        return self.default_timeout
+
+
+class AdmissionMiddleware:
+    """
+    Sheds requests under `path_prefix` with a 503 and `Retry-After` when the admission controller has no slot
+    """
+
+    OVERLOAD_STATUS_CODES = frozenset({503, 504})
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        controller: AdmissionController,
+        path_prefix: str = "/api/",
+        retry_after: int = 1,
+    ) -> None:
+        self.app = app
+        self.controller = controller
+        self.path_prefix = path_prefix
+        self.retry_after = retry_after
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        if not await self.controller.acquire():
+            response = JSONResponse(
+                {"detail": "Service overloaded"},
+                status_code=503,
+                headers={"Retry-After": str(self.retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+
+        status_code = None
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started_at = time.perf_counter()
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            dropped = status_code is None or status_code in self.OVERLOAD_STATUS_CODES
+            self.controller.release(time.perf_counter() - started_at, dropped)
+
+
+class FaultMiddleware:
+    """
+    Drops the connection of requests whose handler raised `ResponseLostError`, after stalling if asked
+
+    The response is started and then abandoned, so the server closes the
+    connection and the client sees it cut off mid-response, as on a reset.
+    The server logs each one as a response that was not completed.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        except ResponseLostError as e:
+            if e.stall > 0:
+                await asyncio.sleep(e.stall)
+
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"application/json")],
+            })
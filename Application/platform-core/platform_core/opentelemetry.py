@@ -0,0 +1,311 @@
+import threading
+
+from collections import OrderedDict
+
+from fastapi import APIRouter, Response
+from opentelemetry import metrics, trace
+from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
+from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+from opentelemetry.exporter.prometheus import PrometheusMetricReader
+from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
+from opentelemetry.sdk.metrics import (
+    AlwaysOffExemplarFilter,
+    AlwaysOnExemplarFilter,
+    Counter,
+    Histogram,
+    MeterProvider,
+    ObservableCounter,
+    ObservableGauge,
+    ObservableUpDownCounter,
+    TraceBasedExemplarFilter,
+    UpDownCounter,
+)
+from opentelemetry.sdk.metrics.export import AggregationTemporality, PeriodicExportingMetricReader
+from opentelemetry.sdk.metrics.view import (
+    ExplicitBucketHistogramAggregation,
+    ExponentialBucketHistogramAggregation,
+    View,
+)
+from opentelemetry.sdk.resources import Resource, ResourceAttributes
+from opentelemetry.sdk.trace import ReadableSpan, SpanProcessor, TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.sdk.trace.sampling import ALWAYS_ON, ParentBased, TraceIdRatioBased
+from opentelemetry.trace import StatusCode
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, generate_latest
+
+from platform_core.stats import StatsCounter
+
+
+_DELTA = AggregationTemporality.DELTA
+_CUMULATIVE = AggregationTemporality.CUMULATIVE
+
+# Temporality preferences as named by OTEL_EXPORTER_OTLP_METRICS_TEMPORALITY_PREFERENCE
+METRIC_TEMPORALITIES = {
+    "cumulative": {},
+    "delta": {
+        Counter: _DELTA,
+        UpDownCounter: _CUMULATIVE,
+        Histogram: _DELTA,
+        ObservableCounter: _DELTA,
+        ObservableUpDownCounter: _CUMULATIVE,
+        ObservableGauge: _CUMULATIVE,
+    },
+    "lowmemory": {
+        Counter: _DELTA,
+        UpDownCounter: _CUMULATIVE,
+        Histogram: _DELTA,
+        ObservableCounter: _CUMULATIVE,
+        ObservableUpDownCounter: _CUMULATIVE,
+        ObservableGauge: _CUMULATIVE,
+    },
+}
+
+EXEMPLAR_FILTERS = {
+    "trace_based": TraceBasedExemplarFilter,
+    "always_on": AlwaysOnExemplarFilter,
+    "always_off": AlwaysOffExemplarFilter,
+}
+
+prometheus_router = APIRouter()
+meter = metrics.get_meter(__name__)
+_tail_sampled = StatsCounter(
+    meter,
+    "tracing.tail_sampling.traces",
+    unit="{trace}",
+    description="Local traces seen by the tail sampler, by decision",
+)
+
+
+class TailSamplingSpanProcessor(SpanProcessor):
+    """
+    Buffers the spans of each trace until its local root span ends, then forwards them to `processor`
+    when the trace failed, was slower than `slow_threshold` or falls within `ratio`
+
+    The ratio decision is taken from the trace id, so services sampling at the
+    same ratio keep the same traces. At most `max_traces` unfinished traces are
+    buffered; the oldest one is dropped when a new one does not fit.
+    """
+
+    def __init__(self, processor: SpanProcessor, *, ratio: float, slow_threshold: float, max_traces: int) -> None:
+        self.processor = processor
+        self.slow_threshold_ns = int(slow_threshold * 1e9)
+        self.max_traces = max_traces
+
+        self._ratio_bound = TraceIdRatioBased.get_bound_for_rate(ratio)
+        self._traces: OrderedDict[int, list[ReadableSpan]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def on_end(self, span: ReadableSpan) -> None:
+        trace_id = span.context.trace_id
+
+        with self._lock:
+            if (spans := self._traces.get(trace_id)) is None:
+                if len(self._traces) >= self.max_traces:
+                    self._traces.popitem(last=False)
+                    _tail_sampled.add(outcome="evicted")
+                spans = self._traces[trace_id] = []
+
+            spans.append(span)
+
+            if span.parent is not None and not span.parent.is_remote:
+                return
+
+            del self._traces[trace_id]
+
+        if not self._keep(trace_id, span, spans):
+            _tail_sampled.add(outcome="dropped")
+            return
+
+        _tail_sampled.add(outcome="kept")
+        for buffered in spans:
+            self.processor.on_end(buffered)
+
+    def _keep(self, trace_id: int, root: ReadableSpan, spans: list[ReadableSpan]) -> bool:
+        if trace_id & TraceIdRatioBased.TRACE_ID_LIMIT < self._ratio_bound:
+            return True
+
+        if root.end_time - root.start_time >= self.slow_threshold_ns:
+            return True
+
+        return any(span.status.status_code is StatusCode.ERROR for span in spans)
+
+    def shutdown(self) -> None:
+        self.processor.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self.processor.force_flush(timeout_millis)
+
+
+def build_resource(service_name: str) -> Resource:
+    return Resource.create({ResourceAttributes.SERVICE_NAME: service_name})
+
+
+def setup_tracing(
+    *,
+    resource: Resource,
+    otel_endpoint: str,
+    insecure: bool = True,
+    sample_ratio: float = 1.0,
+    tail_sampling: bool = False,
+    tail_slow_threshold: float = 1.0,
+    tail_max_traces: int = 10_000,
+    export_queue_size: int = 2048,
+    export_batch_size: int = 512,
+    export_delay_millis: int = 5000,
+    export_timeout_millis: int = 30000,
+) -> TracerProvider:
+    # With tail sampling every span is recorded and the ratio is applied once the trace is complete.
+    sampler = ParentBased(ALWAYS_ON if tail_sampling else TraceIdRatioBased(sample_ratio))
+
+    trace_provider = TracerProvider(resource=resource, sampler=sampler)
+    trace.set_tracer_provider(trace_provider)
+
+    trace_exporter = OTLPSpanExporter(endpoint=otel_endpoint, insecure=insecure)
+    span_processor = BatchSpanProcessor(
+        trace_exporter,
+        max_queue_size=export_queue_size,
+        max_export_batch_size=export_batch_size,
+        schedule_delay_millis=export_delay_millis,
+        export_timeout_millis=export_timeout_millis,
+    )
+
+    if tail_sampling:
+        span_processor = TailSamplingSpanProcessor(
+            span_processor,
+            ratio=sample_ratio,
+            slow_threshold=tail_slow_threshold,
+            max_traces=tail_max_traces,
+        )
+
+    trace_provider.add_span_processor(span_processor)
+
+    return trace_provider
+
+
+def build_histogram_views(
+    *,
+    histogram_aggregation: str = "explicit",
+    histogram_boundaries: dict[str, list[float]] | None = None,
+    exponential_max_size: int = 160,
+) -> list[View]:
+    """
+    Explicit bucket boundaries per instrument name (wildcards allowed), or exponential histograms for every instrument
+    """
+
+    if histogram_aggregation == "exponential":
+        return [
+            View(
+                instrument_type=Histogram,
+                aggregation=ExponentialBucketHistogramAggregation(max_size=exponential_max_size),
+            )
+        ]
+
+    if histogram_aggregation != "explicit":
+        raise ValueError(f"Unknown histogram aggregation: {histogram_aggregation}")
+
+    return [
+        View(
+            instrument_type=Histogram,
+            instrument_name=instrument_name,
+            aggregation=ExplicitBucketHistogramAggregation(boundaries=boundaries),
+        )
+        for instrument_name, boundaries in (histogram_boundaries or {}).items()
+    ]
+
+
+def setup_metrics(
+    *,
+    resource: Resource,
+    otel_endpoint: str,
+    insecure: bool = True,
+    export_interval_millis: int = 1000,
+    temporality: str = "cumulative",
+    histogram_aggregation: str = "explicit",
+    histogram_boundaries: dict[str, list[float]] | None = None,
+    exponential_max_size: int = 160,
+    exemplar_filter: str = "trace_based",
+    exporter: str = "otlp",
+) -> MeterProvider:
+    """
+    Pushes metrics to the collector with `exporter="otlp"`, or leaves them to be scraped from `/metrics` with
+    `exporter="prometheus"`; Prometheus always reads cumulative values, so `temporality` only applies to OTLP
+
+    Exemplars are exported over OTLP only: `PrometheusMetricReader` drops them,
+    so with `exporter="prometheus"` the `exemplar_filter` has no visible effect.
+    """
+
+    if exporter == "otlp":
+        metric_exporter = OTLPMetricExporter(
+            endpoint=otel_endpoint,
+            insecure=insecure,
+            preferred_temporality=METRIC_TEMPORALITIES[temporality],
+        )
+        metric_reader = PeriodicExportingMetricReader(
+            metric_exporter,
+            export_interval_millis=export_interval_millis,
+        )
+    elif exporter == "prometheus":
+        metric_reader = PrometheusMetricReader()
+    else:
+        raise ValueError(f"Unknown metrics exporter: {exporter}")
+
+    metrics_provider = MeterProvider(
+        resource=resource,
+        metric_readers=[metric_reader],
+        views=build_histogram_views(
+            histogram_aggregation=histogram_aggregation,
+            histogram_boundaries=histogram_boundaries,
+            exponential_max_size=exponential_max_size,
+        ),
+        exemplar_filter=EXEMPLAR_FILTERS[exemplar_filter](),
+    )
+    metrics.set_meter_provider(metrics_provider)
+
+    return metrics_provider
+
+
+@prometheus_router.get("/metrics", include_in_schema=False)
+def prometheus_metrics() -> Response:
+    return Response(generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
+
+
+def instrument_fastapi_and_httpx(app) -> None:
+    HTTPXClientInstrumentor().instrument()
+    FastAPIInstrumentor.instrument_app(app, excluded_urls="/metrics")
+
+
+def setup_observability(
+    *,
+    app,
+    service_name: str,
+    otel_endpoint: str,
+    insecure: bool = True,
+    metrics_exporter: str = "otlp",
+    tracing_options: dict | None = None,
+    metrics_options: dict | None = None,
+) -> None:
+    """
+    `tracing_options` and `metrics_options` are passed on to `setup_tracing` and `setup_metrics`
+    """
+
+    resource = build_resource(service_name)
+
+    setup_tracing(
+        resource=resource,
+        otel_endpoint=otel_endpoint,
+        insecure=insecure,
+        **(tracing_options or {}),
+    )
+    setup_metrics(
+        resource=resource,
+        otel_endpoint=otel_endpoint,
+        insecure=insecure,
+        exporter=metrics_exporter,
+        **(metrics_options or {}),
+    )
+
+    if metrics_exporter == "prometheus":
+        app.include_router(prometheus_router)
+
+    instrument_fastapi_and_httpx(app)
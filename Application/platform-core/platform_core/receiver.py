@@ -0,0 +1,133 @@
+import logging
+import asyncio
+
+from contextlib import contextmanager
+from functools import partial
+from typing import Awaitable, Callable, Sequence
+
+from fastapi import HTTPException
+from opentelemetry import metrics
+from pydantic import BaseModel
+
+from platform_core.deadline import DeadlineExceededError, check_deadline
+from platform_core.faults import FaultDecision, FaultEngine, InjectedFaultError, ResponseLostError
+from platform_core.ledger import ledger
+from platform_core.stats import StatsCounter
+
+
+logger = logging.getLogger(__name__)
+meter = metrics.get_meter(__name__)
+
+_requests = StatsCounter(meter, "receiver.requests", description="Messages received from ServiceA, by outcome")
+_batches = StatsCounter(meter, "receiver.batches", unit="{batch}", description="Batch requests received from ServiceA")
+
+Process = Callable[[], Awaitable[dict]]
+# Runs `process` for an idempotency key unless a delivery of that key already
+# did; returns the result and whether it came from the earlier delivery.
+Deduplicate = Callable[[str, Process], Awaitable[tuple[dict, bool]]]
+
+
+class Message(BaseModel):
+    message: str
+    sender_epoch: str | None = None
+    sequence_id: int | None = None
+
+
+class BatchItem(Message):
+    idempotency_key: str | None = None
+
+
+class MessageBatch(BaseModel):
+    messages: list[BatchItem]
+
+
+class Receiver:
+    """
+    ServiceB's handling of a delivered message: deadline, injected faults, outcome counters and the delivery ledger
+
+    A message that gets through is counted under `outcome`. With `deduplicate`
+    the processing of a message runs through it under the message's idempotency
+    key, and a repeated delivery is counted as `duplicate` and left out of the ledger.
+    An injected delay is applied before deduplication, like a slow network would
+    be, so a hedged copy is not held behind the delayed original.
+    """
+
+    def __init__(self, *, outcome: str) -> None:
+        self.outcome = outcome
+
+    async def receive(
+        self,
+        faults: FaultEngine,
+        message: Message,
+        *,
+        deduplicate: Deduplicate | None = None,
+        idempotency_key: str | None = None,
+    ) -> dict:
+        decision = faults.decide()
+        with self._abandon_past_deadline():
+            await faults.delay(decision)
+
+        process = partial(self._process, faults, decision)
+
+        if deduplicate is None:
+            result, duplicate = await process(), False
+        else:
+            result, duplicate = await deduplicate(idempotency_key, process)
+
+        outcome = "duplicate" if duplicate else self.outcome
+        _requests.add(outcome=outcome)
+        if not duplicate:
+            ledger.record(message.sender_epoch, message.sequence_id)
+        logger.debug("Message %s", outcome)
+
+        faults.complete(decision)
+        return result
+
+    async def receive_batch(
+        self,
+        faults: FaultEngine,
+        items: Sequence[BatchItem],
+        *,
+        deduplicate: Deduplicate | None = None,
+    ) -> dict:
+        _batches.add()
+        results = await asyncio.gather(
+            *(
+                self.receive(faults, item, deduplicate=deduplicate, idempotency_key=item.idempotency_key)
+                for item in items
+            ),
+            return_exceptions=True,
+        )
+        return {"results": [_batch_item_result(result) for result in results]}
+
+    async def _process(self, faults: FaultEngine, decision: FaultDecision) -> dict:
+        try:
+            with self._abandon_past_deadline():
+                check_deadline()
+                await faults.inject(decision)
+        except (InjectedFaultError, ResponseLostError):
+            _requests.add(outcome="failed")
+            logger.debug("Message failed")
+            raise
+
+        return {"result": "ok"}
+
+    @staticmethod
+    @contextmanager
+    def _abandon_past_deadline():
+        try:
+            yield
+        except DeadlineExceededError:
+            _requests.add(outcome="abandoned")
+            logger.debug("Message abandoned, the caller's deadline has passed")
+            raise HTTPException(status_code=504, detail="Deadline exceeded")
+
+
+def _batch_item_result(result: dict | BaseException) -> dict:
+    if isinstance(result, HTTPException):
+        return {"status_code": result.status_code, "detail": result.detail}
+
+    if isinstance(result, BaseException):
+        raise result
+
+    return {"status_code": 200, "result": result}
@@ -0,0 +1,147 @@
+import time
+import httpx
+import random
+
+from collections import deque
+
+from opentelemetry import metrics
+from tenacity import AsyncRetrying, RetryCallState, retry_if_exception
+
+from platform_core.batcher import BatchItemError
+from platform_core.deadline import get_remaining
+from platform_core.stats import StatsCounter
+
+
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+meter = metrics.get_meter(__name__)
+_budget_exhausted = StatsCounter(
+    meter,
+    "forwarder.retry.budget_exhausted",
+    unit="{retry}",
+    description="Retries refused because the retry budget was spent",
+)
+
+
+def full_jitter_backoff(attempt_number: int, *, initial_backoff: float, max_backoff: float) -> float:
+    """
+    Delay after the `attempt_number`-th failed attempt: uniform up to `initial_backoff * 2 ** (attempt_number - 1)`,
+    capped at `max_backoff`
+    """
+
+    # The cap is reached long before 2 ** 63; clamping keeps the float from overflowing.
+    exponent = min(attempt_number - 1, 63)
+    return random.uniform(0, min(max_backoff, initial_backoff * 2 ** exponent))
+
+
+class RetryBudget:
+    """
+    Token bucket that allows retries for up to `ratio` of the requests seen in the last `window_seconds`
+
+    Every request deposits `ratio` tokens and every retry withdraws one; deposits
+    older than the window expire. `min_retries_per_second` keeps a small floor so
+    that low traffic can still retry.
+    """
+
+    def __init__(self, *, ratio: float, min_retries_per_second: float, window_seconds: int) -> None:
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.window_seconds = window_seconds
+
+        # [second, requests, retries] for each second of the window
+        self._buckets: deque[list[int]] = deque()
+
+    def record_request(self) -> None:
+        self._current_bucket()[1] += 1
+
+    def try_acquire(self) -> bool:
+        bucket = self._current_bucket()
+        requests = sum(b[1] for b in self._buckets)
+        retries = sum(b[2] for b in self._buckets)
+
+        allowed = self.min_retries_per_second * self.window_seconds + self.ratio * requests
+        if retries + 1 > allowed:
+            return False
+
+        bucket[2] += 1
+        return True
+
+    def _current_bucket(self) -> list[int]:
+        second = int(time.monotonic())
+
+        while self._buckets and self._buckets[0][0] <= second - self.window_seconds:
+            self._buckets.popleft()
+
+        if not self._buckets or self._buckets[-1][0] != second:
+            self._buckets.append([second, 0, 0])
+
+        return self._buckets[-1]
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter, limited by attempts, a shared retry budget and the request deadline
+    """
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int,
+        initial_backoff: float,
+        max_backoff: float,
+        budget: RetryBudget,
+        retryable_status_codes: frozenset[int] = RETRYABLE_STATUS_CODES,
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.budget = budget
+        self.retryable_status_codes = retryable_status_codes
+
+    def retrying(self) -> AsyncRetrying:
+        self.budget.record_request()
+
+        return AsyncRetrying(
+            stop=self._should_stop,
+            wait=self._wait,
+            retry=retry_if_exception(self.is_retryable),
+            reraise=True,
+        )
+
+    def is_retryable(self, exception: BaseException) -> bool:
+        if isinstance(exception, httpx.HTTPStatusError):
+            return exception.response.status_code in self.retryable_status_codes
+
+        if isinstance(exception, BatchItemError):
+            return exception.status_code in self.retryable_status_codes
+
+        return isinstance(exception, httpx.TransportError)
+
+    def _should_stop(self, retry_state: RetryCallState) -> bool:
+        # Only consulted once an attempt failed with a retryable error.
+        if retry_state.attempt_number >= self.max_attempts:
+            return True
+
+        remaining = get_remaining()
+        if remaining is not None and remaining <= 0:
+            return True
+
+        if not self.budget.try_acquire():
+            _budget_exhausted.add()
+            return True
+
+        return False
+
+    def _wait(self, retry_state: RetryCallState) -> float:
+        # Never sleep past the deadline; the next attempt then fails fast.
+        backoff = full_jitter_backoff(
+            retry_state.attempt_number,
+            initial_backoff=self.initial_backoff,
+            max_backoff=self.max_backoff,
+        )
+        remaining = get_remaining()
+
+        if remaining is None:
+            return backoff
+
+        return min(backoff, max(remaining, 0))
@@ -0,0 +1,100 @@
+import json
+
+from typing import Any, Callable, Literal
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from starlette.types import Receive, Scope
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+
+WireFormat = Literal["json", "msgpack"]
+
+
+def require_orjson() -> None:
+    if orjson is None:
+        raise RuntimeError("The fast JSON path needs orjson, install platform-core[fast]")
+
+
+def require_msgpack() -> None:
+    if msgpack is None:
+        raise RuntimeError("The msgpack wire format needs msgpack, install platform-core[fast]")
+
+
+class Codec:
+    """
+    Encodes the bodies of requests to another service and decodes its JSON replies
+
+    `json` bodies go through orjson with `fast_json` and the standard library
+    otherwise, `msgpack` bodies through msgpack. Either way the body is handed to
+    httpx pre-serialised, as `content=` with `content_type`.
+    """
+
+    def __init__(self, *, wire_format: WireFormat = "json", fast_json: bool = False) -> None:
+        if fast_json:
+            require_orjson()
+        if wire_format == "msgpack":
+            require_msgpack()
+
+        self.wire_format = wire_format
+        self.fast_json = fast_json
+        self.content_type = MSGPACK_CONTENT_TYPE if wire_format == "msgpack" else JSON_CONTENT_TYPE
+
+    def encode(self, payload: Any) -> bytes:
+        if self.wire_format == "msgpack":
+            return msgpack.packb(payload)
+        if self.fast_json:
+            return orjson.dumps(payload)
+        return json.dumps(payload, separators=(",", ":")).encode()
+
+    def decode_json(self, body: bytes) -> Any:
+        return orjson.loads(body) if self.fast_json else json.loads(body)
+
+
+class MsgpackRequest(Request):
+    """
+    Request whose msgpack body FastAPI reads as if it were JSON
+    """
+
+    def __init__(self, scope: Scope, receive: Receive) -> None:
+        headers = [
+            (name, JSON_CONTENT_TYPE.encode()) if name == b"content-type" else (name, value)
+            for name, value in scope["headers"]
+        ]
+        super().__init__({**scope, "headers": headers}, receive)
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = msgpack.unpackb(await self.body())
+        return self._json
+
+
+class CodecRoute(APIRoute):
+    """
+    Route that also accepts `application/msgpack` request bodies, validated like JSON ones
+    """
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            if request.headers.get("content-type") == MSGPACK_CONTENT_TYPE:
+                if msgpack is None:
+                    return Response(status_code=415)
+                request = MsgpackRequest(request.scope, request.receive)
+
+            return await handler(request)
+
+        return route_handler
@@ -0,0 +1,46 @@
+import asyncio
+import sqlite3
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Sequence
+
+
+class SqliteExecutor:
+    """
+    WAL-mode SQLite connection driven from asyncio through a dedicated thread
+
+    A single thread owns the connection, which also serialises access to it;
+    `run` hands it a function that uses `connection`. The file may be shared by
+    several processes, each with its own executor. `schema` statements run once
+    the connection is open.
+    """
+
+    def __init__(self, path: str, *, schema: Sequence[str] = (), thread_name_prefix: str = "sqlite") -> None:
+        self.path = path
+        self.schema = schema
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=thread_name_prefix)
+        self._connection: sqlite3.Connection | None = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        return self._connection
+
+    async def open(self) -> None:
+        await self.run(self._connect)
+
+    async def close(self) -> None:
+        if self._connection is not None:
+            await self.run(self._connection.close)
+
+        self._executor.shutdown(wait=True)
+
+    async def run(self, func: Callable[..., Any], *args) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _connect(self) -> None:
+        self._connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        for statement in self.schema:
+            self._connection.execute(statement)
@@ -0,0 +1,49 @@
+from fastapi import APIRouter
+from opentelemetry.metrics import Meter
+
+from platform_core.logging import dropped_log_records
+
+
+router = APIRouter()
+_counters: list["StatsCounter"] = []
+
+
+class StatsCounter:
+    """
+    OpenTelemetry counter that also keeps a local tally for the `/stats` snapshot
+    """
+
+    def __init__(self, meter: Meter, name: str, *, unit: str = "{message}", description: str = "") -> None:
+        self.name = name
+        self._instrument = meter.create_counter(name, unit=unit, description=description)
+        self._attributes: dict[str | None, dict] = {None: {}}
+        self._totals: dict[str | None, int] = {}
+
+        _counters.append(self)
+
+    def add(self, amount: int = 1, outcome: str | None = None) -> None:
+        if (attributes := self._attributes.get(outcome)) is None:
+            attributes = self._attributes[outcome] = {"outcome": outcome}
+
+        self._instrument.add(amount, attributes)
+        self._totals[outcome] = self._totals.get(outcome, 0) + amount
+
+    def snapshot(self) -> int | dict[str, int]:
+        total = sum(self._totals.values())
+
+        if not any(outcome is not None for outcome in self._totals):
+            return total
+
+        return {"total": total, **{outcome: value for outcome, value in self._totals.items() if outcome is not None}}
+
+
+def stats_snapshot() -> dict:
+    return {
+        **{counter.name: counter.snapshot() for counter in _counters},
+        "logging.dropped_records": dropped_log_records(),
+    }
+
+
+@router.get("/stats")
+async def stats() -> dict:
+    return stats_snapshot()
@@ -0,0 +1,76 @@
+import asyncio
+
+from platform_core.admission import AdmissionController, AIMDLimit, FixedLimit
+
+
+def make_controller(*, limit: int = 2, max_queue: int = 1, queue_timeout: float = 1.0) -> AdmissionController:
+    return AdmissionController(
+        FixedLimit(initial_limit=limit, min_limit=1, max_limit=limit),
+        max_queue=max_queue,
+        queue_timeout=queue_timeout,
+    )
+
+
+def test_admits_up_to_the_limit_and_queues_the_next_request():
+    async def scenario():
+        controller = make_controller()
+
+        assert await controller.acquire()
+        assert await controller.acquire()
+        assert controller.in_flight == 2
+
+        queued = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        assert controller.queue_depth == 1
+        assert not queued.done()
+
+        controller.release(0.01, dropped=False)
+        assert await queued
+        assert controller.in_flight == 2
+        assert controller.queue_depth == 0
+
+    asyncio.run(scenario())
+
+
+def test_sheds_requests_beyond_the_queue():
+    async def scenario():
+        controller = make_controller(limit=1, max_queue=1)
+
+        assert await controller.acquire()
+        queued = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+
+        assert not await controller.acquire()
+
+        controller.release(0.01, dropped=False)
+        assert await queued
+
+    asyncio.run(scenario())
+
+
+def test_sheds_requests_that_wait_too_long():
+    async def scenario():
+        controller = make_controller(limit=1, max_queue=5, queue_timeout=0.01)
+
+        assert await controller.acquire()
+        assert not await controller.acquire()
+        assert controller.queue_depth == 0
+        assert controller.in_flight == 1
+
+    asyncio.run(scenario())
+
+
+def test_aimd_limit_shrinks_on_drops_and_grows_while_in_use():
+    limit = AIMDLimit(latency_threshold=0.5, backoff_ratio=0.5, initial_limit=10, min_limit=2, max_limit=20)
+
+    limit.update(0.01, in_flight=10, dropped=True)
+    assert limit.limit == 5
+
+    limit.update(1.0, in_flight=5, dropped=False)
+    assert limit.limit == 2
+
+    limit.update(0.01, in_flight=2, dropped=False)
+    assert limit.limit == 3
+
+    limit.update(0.01, in_flight=1, dropped=False)
+    assert limit.limit == 3
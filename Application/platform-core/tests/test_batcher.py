@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+
+from platform_core.batcher import BatchItemError, MicroBatcher
+
+
+def test_results_fan_out_to_their_callers():
+    async def scenario():
+        batches = []
+
+        async def send_batch(items):
+            batches.append(items)
+            return [item * 10 for item in items]
+
+        batcher = MicroBatcher(send_batch, max_items=3, max_delay_ms=1000)
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(7)))
+        await batcher.close()
+
+        assert results == [i * 10 for i in range(7)]
+        assert batches == [[0, 1, 2], [3, 4, 5], [6]]
+
+    asyncio.run(scenario())
+
+
+def test_partial_batch_is_sent_after_the_delay():
+    async def scenario():
+        batches = []
+
+        async def send_batch(items):
+            batches.append(items)
+            return items
+
+        batcher = MicroBatcher(send_batch, max_items=100, max_delay_ms=5)
+        assert await asyncio.wait_for(batcher.submit("a"), 1) == "a"
+        assert batches == [["a"]]
+
+    asyncio.run(scenario())
+
+
+def test_send_failure_reaches_every_caller():
+    async def scenario():
+        async def send_batch(items):
+            raise ConnectionError("reset")
+
+        batcher = MicroBatcher(send_batch, max_items=2, max_delay_ms=1000)
+        results = await asyncio.gather(batcher.submit(1), batcher.submit(2), return_exceptions=True)
+
+        assert all(isinstance(result, ConnectionError) for result in results)
+
+    asyncio.run(scenario())
+
+
+def test_short_reply_fails_the_callers_left_over():
+    async def scenario():
+        async def send_batch(items):
+            return items[:1]
+
+        batcher = MicroBatcher(send_batch, max_items=3, max_delay_ms=1000)
+        results = await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(i) for i in range(3)), return_exceptions=True),
+            1,
+        )
+
+        assert results[0] == 0
+        for result in results[1:]:
+            assert isinstance(result, BatchItemError)
+            assert result.status_code == 502
+
+    asyncio.run(scenario())
+
+
+def test_close_flushes_the_pending_batch():
+    async def scenario():
+        sent = []
+
+        async def send_batch(items):
+            sent.extend(items)
+            return items
+
+        batcher = MicroBatcher(send_batch, max_items=100, max_delay_ms=60_000)
+        pending = asyncio.create_task(batcher.submit("late"))
+        await asyncio.sleep(0)
+        await batcher.close()
+
+        assert await pending == "late"
+        assert sent == ["late"]
+
+    asyncio.run(scenario())
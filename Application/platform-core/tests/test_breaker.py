@@ -0,0 +1,141 @@
+import asyncio
+import types
+
+import httpx
+import pytest
+
+from platform_core import breaker as breaker_module
+from platform_core.breaker import CircuitBreaker, CircuitOpenError
+from platform_core.deadline import DeadlineExceededError
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(breaker_module, "time", types.SimpleNamespace(monotonic=clock.monotonic))
+    return clock
+
+
+def status_error(status_code: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "http://service-b/api/message-b")
+    response = httpx.Response(status_code, request=request)
+    return httpx.HTTPStatusError(f"{status_code}", request=request, response=response)
+
+
+async def call(breaker: CircuitBreaker, error: Exception | None = None) -> None:
+    async with breaker.guard():
+        if error is not None:
+            raise error
+
+
+async def fail(breaker: CircuitBreaker, error: Exception) -> None:
+    with pytest.raises(type(error)):
+        await call(breaker, error)
+
+
+def make_breaker(**kwargs) -> CircuitBreaker:
+    options = {"window_size": 4, "min_calls": 4, "failure_rate_threshold": 0.5, "open_seconds": 5.0}
+    return CircuitBreaker("service-b", **{**options, **kwargs})
+
+
+def test_opens_once_the_failure_rate_is_reached(clock):
+    async def scenario():
+        breaker = make_breaker()
+
+        await call(breaker)
+        await call(breaker)
+        await fail(breaker, status_error(503))
+        assert breaker.state == CircuitBreaker.CLOSED
+
+        await fail(breaker, httpx.ConnectError("refused"))
+        assert breaker.state == CircuitBreaker.OPEN
+
+        with pytest.raises(CircuitOpenError):
+            await call(breaker)
+
+    asyncio.run(scenario())
+
+
+def test_client_errors_count_as_successes_and_other_errors_are_ignored(clock):
+    async def scenario():
+        breaker = make_breaker(min_calls=2, window_size=2)
+
+        await fail(breaker, status_error(422))
+        await fail(breaker, DeadlineExceededError())
+        await fail(breaker, status_error(503))
+        assert breaker.state == CircuitBreaker.OPEN  # 1 of 2 recorded calls failed
+
+        breaker = make_breaker(min_calls=2, window_size=2)
+        for _ in range(5):
+            await fail(breaker, DeadlineExceededError())
+        await fail(breaker, status_error(422))
+        await fail(breaker, status_error(422))
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    asyncio.run(scenario())
+
+
+def test_successful_probe_closes_after_the_open_period(clock):
+    async def scenario():
+        breaker = make_breaker(min_calls=1, window_size=1)
+        await fail(breaker, status_error(503))
+        assert breaker.state == CircuitBreaker.OPEN
+
+        clock.now += 4.9
+        with pytest.raises(CircuitOpenError):
+            await call(breaker)
+
+        clock.now += 0.2
+        await call(breaker)
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    asyncio.run(scenario())
+
+
+def test_failed_probe_reopens(clock):
+    async def scenario():
+        breaker = make_breaker(min_calls=1, window_size=1)
+        await fail(breaker, status_error(503))
+
+        clock.now += 5.0
+        await fail(breaker, httpx.ReadTimeout("slow"))
+        assert breaker.state == CircuitBreaker.OPEN
+
+        with pytest.raises(CircuitOpenError):
+            await call(breaker)
+
+    asyncio.run(scenario())
+
+
+def test_half_open_admits_a_limited_number_of_probes(clock):
+    async def scenario():
+        breaker = make_breaker(min_calls=1, window_size=1, half_open_max_calls=1)
+        await fail(breaker, status_error(503))
+        clock.now += 5.0
+
+        release = asyncio.Event()
+
+        async def slow_probe():
+            async with breaker.guard():
+                await release.wait()
+
+        probe = asyncio.create_task(slow_probe())
+        await asyncio.sleep(0)
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+
+        with pytest.raises(CircuitOpenError):
+            await call(breaker)
+
+        release.set()
+        await probe
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    asyncio.run(scenario())